@@ -1,29 +1,75 @@
+import hmac
 import os
-from datetime import date
-from flask import Flask, render_template, request, redirect, session, url_for, flash, jsonify
+from datetime import date, timedelta
+from flask import (
+    Blueprint, Flask, Response, current_app, render_template, request, redirect, session, url_for, flash, jsonify,
+    stream_with_context
+)
 from dotenv import load_dotenv
 from models.models import init_db
+from models.instrumentation import init_instrumentation, metrics
+from models.cli import register_cli, setup_database
+from models.cache import render_cache
 import models.services as svc
+import models.events as events
+import models.availability as availability
+import models.analytics as analytics
+import models.importer as importer
 from models.utils import (
+    compressed_json,
     parse_custom_date,
     handle_users_view,
     handle_vacation_view,
     handle_category_view,
-    handle_backlog_view
+    handle_backlog_view,
+    handle_board_page,
+    handle_gantt_data,
+    handle_task_update,
+    handle_task_details,
+    handle_search,
+    handle_archive_page,
+    handle_export,
+    render_cached,
+    stream_changes,
+    BOARD_PAGE_SIZE
 )
 
-load_dotenv()
+MAX_AVAILABILITY_DAYS = 3660
+
+bp = Blueprint("kanban", __name__)
+
+
+def create_app():
+    """
+    Create and configure the application.
+
+    Loads the .env file, connects the database and registers the routes,
+    instrumentation and CLI commands. No database work is done here, so
+    every process and worker starts without a schema round trip: the schema
+    is created or upgraded once with ``flask --app app upgrade-db``.
+
+    Used by the Flask CLI (``flask --app app ...``), ``wsgi.py`` and
+    ``python app.py``.
 
-PASSWORD = os.environ.get("APP_PASSWORD")
-USERNAME = os.environ.get("APP_USERNAME")
+    :return: Configured Flask application.
+    """
+    load_dotenv()
 
-app = Flask(__name__)
-app.secret_key = "super_secret_key"
+    app = Flask(__name__)
+    app.secret_key = "super_secret_key"
+    app.config["APP_USERNAME"] = os.environ.get("APP_USERNAME")
+    app.config["APP_PASSWORD"] = os.environ.get("APP_PASSWORD")
+    app.config["METRICS_TOKEN"] = os.environ.get("METRICS_TOKEN")
+    render_cache.max_entries = int(os.environ.get("RENDER_CACHE_SIZE", render_cache.max_entries))
 
-init_db(app)
+    init_db(app)
+    init_instrumentation(app)
+    register_cli(app)
+    app.register_blueprint(bp)
+    return app
 
 
-@app.route("/login", methods=["GET", "POST"])
+@bp.route("/login", methods=["GET", "POST"])
 def login():
     """
     Handle user login. On POST, verify credentials and start a session.
@@ -34,14 +80,14 @@ def login():
     if request.method == "POST":
         username = request.form.get("username")
         password = request.form.get("password")
-        if username == USERNAME and password == PASSWORD:
+        if username == current_app.config["APP_USERNAME"] and password == current_app.config["APP_PASSWORD"]:
             session["logged_in"] = True
-            return redirect(url_for("index"))
+            return redirect(url_for(".index"))
         return render_template("login.html", error="Login or password incorrect")
     return render_template("login.html")
 
 
-@app.route("/logout")
+@bp.route("/logout")
 def logout():
     """
     Log out the current user by clearing the session.
@@ -49,10 +95,10 @@ def logout():
     :return: Redirect to login page.
     """
     session.pop("logged_in", None)
-    return redirect(url_for("login"))
+    return redirect(url_for(".login"))
 
 
-@app.route("/add_user", methods=["POST"])
+@bp.route("/add_user", methods=["POST"])
 def add_user():
     """
     Add a new user to the database from the form submission.
@@ -64,10 +110,10 @@ def add_user():
         svc.add_user_to_db(username)
 
     view = request.form.get("view", "users")
-    return redirect(url_for("index", user=username, view=view))
+    return redirect(url_for(".index", user=username, view=view))
 
 
-@app.route("/delete_user/<username>")
+@bp.route("/delete_user/<username>")
 def delete_user(username):
     """
     Delete a user from the database and select another user if available.
@@ -76,75 +122,418 @@ def delete_user(username):
     :return: Redirect to index page with a selected user.
     """
     svc.delete_user_from_db(username)
-    remaining_users = [u.username for u in svc.User.query.all()]
+    remaining_users = svc.get_usernames()
     selected_user = remaining_users[0] if remaining_users else None
 
     view = request.args.get("view", "users")
-    return redirect(url_for("index", user=selected_user, view=view))
+    return redirect(url_for(".index", user=selected_user, view=view))
 
 
-@app.route("/")
+@bp.route("/")
 def index():
     """
     Display the main planner page with different views.
 
     - Redirects to login page if the user is not logged in.
-    - Retrieves view type and selected user from query parameters.
+    - Retrieves view type, selected user and tag filter from query parameters.
     - Loads tasks based on the selected view.
     - Passes tasks, users, and other context variables to the index template.
+    - Serves unchanged boards from the render cache (with ETag/304 support)
+      unless there are flash messages to show.
 
     Returns:
         Response: Rendered HTML template for the planner's main page,
         or a redirect to the login page if not logged in.
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     view = request.args.get("view", "users")
     selected_user = request.args.get("user")
+    tag = request.args.get("tag", "").strip() or None
+
+    def render():
+        users = svc.get_usernames()
+
+        if view == "users":
+            return handle_users_view(selected_user, users, view, tag)
+        elif view in ["ad-hoc", "reg", "pro"]:
+            return handle_category_view(view.upper(), selected_user, users, view, tag)
+        elif view == "vacation":
+            return handle_vacation_view(selected_user, users, view)
+        elif view == "backlog":
+            return handle_backlog_view(users, view, tag)
+        else:
+            return handle_users_view(selected_user, users, "users", tag)
+
+    if session.get("_flashes"):
+        return render()
+
+    key = (view, selected_user, tag, svc.get_board_version(), date.today())
+    return render_cached(key, render)
+
+
+@bp.route("/summary")
+def get_summary():
+    """
+    Return card counts per status, category and user, plus overdue counts, in JSON format.
+
+    Query parameters:
+        category: Optional task category (AD-HOC, REG, PRO)
+        user: Optional username
+        tag: Optional tag
 
-    users = [u.username for u in svc.User.query.all()]
+    Returns:
+        JSON response with the summary
+    """
+    if not session.get("logged_in"):
+        return redirect(url_for(".login"))
 
-    if view == "users":
-        return handle_users_view(selected_user, users, view)
-    elif view in ["ad-hoc", "reg", "pro"]:
-        return handle_category_view(view.upper(), selected_user, users, view)
-    elif view == "vacation":
-        return handle_vacation_view(selected_user, users, view)
-    elif view == "backlog":
-        return handle_backlog_view(users, view)
-    else:
-        return handle_users_view(selected_user, users, "users")
+    category = request.args.get("category")
+    user = request.args.get("user")
+    tag = request.args.get("tag", "").strip() or None
+
+    return jsonify(svc.get_task_summary(
+        category.upper() if category else None,
+        user if user != "all" else None,
+        tag
+    ))
+
+
+@bp.route("/flow_metrics")
+def get_flow_metrics():
+    """
+    Return throughput, lead time, cycle time and aging WIP per user and category in JSON format.
+
+    Query parameters:
+        start: Period start (dd/mm/yyyy or yyyy-mm-dd), defaults to 90 days before end
+        end: Period end (dd/mm/yyyy or yyyy-mm-dd), defaults to today
+
+    Returns:
+        JSON response with the flow metrics of the tasks finished in the period
+    """
+    if not session.get("logged_in"):
+        return redirect(url_for(".login"))
+
+    try:
+        end_date = parse_custom_date(request.args.get("end")) or date.today()
+        start_date = parse_custom_date(request.args.get("start")) or end_date - timedelta(days=90)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if end_date < start_date:
+        return jsonify({"error": "Period end is before its start"}), 400
+
+    return jsonify(analytics.get_flow_metrics(start_date, end_date))
+
+
+@bp.route("/render_cache_stats")
+def render_cache_stats():
+    """
+    Return the hit-rate counters of the board render cache of this process.
+
+    Returns:
+        JSON response with hits, misses, 304 responses, size and hit rate
+    """
+    if not session.get("logged_in"):
+        return redirect(url_for(".login"))
 
+    return jsonify(render_cache.stats())
 
-@app.route("/get_vacations_data")
+
+@bp.route("/metrics")
+def get_metrics():
+    """
+    Return request, SQL and template metrics of this process in the Prometheus text format.
+
+    Allowed for logged in users and for scrapers sending
+    ``Authorization: Bearer <METRICS_TOKEN>``.
+
+    Returns:
+        Plain text response with the metrics
+    """
+    token = current_app.config["METRICS_TOKEN"]
+    authorized = session.get("logged_in") or (
+        token and hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}")
+    )
+    if not authorized:
+        return Response("Unauthorized\n", status=401, mimetype="text/plain")
+
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@bp.route("/get_vacations_data")
 def get_vacations_data():
     """
     Return vacations data in JSON format for Gantt chart
 
+    Query parameters:
+        start: Optional period start (dd/mm/yyyy or yyyy-mm-dd)
+        end: Optional period end (dd/mm/yyyy or yyyy-mm-dd)
+        user: Optional username
+
+    Returns:
+        Columnar JSON response with the vacations overlapping the period
+    """
+    if not session.get("logged_in"):
+        return redirect(url_for(".login"))
+
+    try:
+        start_date = parse_custom_date(request.args.get("start"))
+        end_date = parse_custom_date(request.args.get("end"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    user = request.args.get("user")
+    if user == "all":
+        user = None
+
+    return handle_gantt_data(start_date, end_date, user)
+
+
+@bp.route("/get_board_page")
+def get_board_page():
+    """
+    Return the next page of a board column in JSON format.
+    Used by the board to load more cards on scroll.
+
+    Query parameters:
+        view: Current view
+        user: Selected user
+        status: Column to load (todo, in_progress, waiting, done)
+        cursor: Cursor returned with the previous page
+        limit: Page size (at most 200)
+        tag: Optional tag to filter by
+
     Returns:
-        JSON response with vacations data
+        JSON response with tasks and the cursor of the next page
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
+
+    view = request.args.get("view", "backlog")
+    selected_user = request.args.get("user")
+    status = request.args.get("status", "todo")
+    cursor = request.args.get("cursor")
+    limit = max(1, min(request.args.get("limit", BOARD_PAGE_SIZE, type=int), 200))
+    tag = request.args.get("tag", "").strip() or None
 
-    vacations = svc.get_gantt_vacations()
+    return handle_board_page(view, selected_user, status, cursor, limit, tag)
 
-    vacations_data = []
-    for vacation in vacations:
-        vacations_data.append({
-            "id": vacation.id,
-            "username": vacation.user.username,
-            "start_date": vacation.start_date.isoformat(),
-            "end_date": vacation.end_date.isoformat(),
-            "status": vacation.status,
-            "comment": vacation.comment
-        })
 
-    return jsonify(vacations_data)
+@bp.route("/search")
+def search_tasks():
+    """
+    Return tasks matching a full-text search in JSON format, best match first.
+
+    Query parameters:
+        q: Search string, every word must match a title, comment or tag
+        page: Page number, starting at 1
+        limit: Page size (at most 100)
 
+    Returns:
+        JSON response with the tasks of the page and whether there are more
+    """
+    if not session.get("logged_in"):
+        return jsonify({"error": "Not logged in"}), 401
 
-@app.route("/delete_vacation", methods=["POST"])
+    text = request.args.get("q", "").strip()
+    page = max(1, request.args.get("page", 1, type=int))
+    limit = max(1, min(request.args.get("limit", 20, type=int), 100))
+
+    return handle_search(text, page, limit)
+
+
+@bp.route("/export")
+def export_tasks():
+    """
+    Download the tasks of a category or the backlog as CSV or JSON Lines.
+
+    Rows are streamed from the database in batches, so large exports are
+    not held in memory.
+
+    Query parameters:
+        view: ad-hoc, reg, pro or backlog
+        user: Optional username, or "all" (category views only)
+        tag: Optional tag to filter tasks by
+        format: csv (default) or jsonl
+
+    Returns:
+        Streaming response with the export as an attachment
+    """
+    if not session.get("logged_in"):
+        return jsonify({"error": "Not logged in"}), 401
+
+    view = request.args.get("view", "backlog")
+    selected_user = request.args.get("user", "all")
+    tag = request.args.get("tag", "").strip() or None
+    fmt = request.args.get("format", "csv")
+
+    return handle_export(view, selected_user, svc.get_usernames(), fmt, tag)
+
+
+@bp.route("/import", methods=["POST"])
+def import_tasks():
+    """
+    Create tasks from an uploaded CSV or JSON Lines file.
+
+    Form fields:
+        file: The file, with the columns of an export (username and title are required)
+        format: csv or jsonl, taken from the file extension if not given
+
+    Returns:
+        JSON report with the number of imported rows, the rows with errors
+        and the rows per second
+    """
+    if not session.get("logged_in"):
+        return jsonify({"error": "Not logged in"}), 401
+
+    upload = request.files.get("file")
+    if not upload:
+        return jsonify({"error": "No file uploaded"}), 400
+
+    fmt = request.form.get("format") or os.path.splitext(upload.filename or "")[1].lstrip(".").lower()
+    if fmt not in importer.IMPORT_FORMATS:
+        return jsonify({"error": f"Unknown format: {fmt}"}), 400
+
+    records = importer.read_import_rows(importer.open_import_stream(upload.stream, fmt), fmt)
+    try:
+        report = importer.import_tasks(records)
+    except UnicodeDecodeError:
+        return jsonify({"error": "The file is not UTF-8 encoded"}), 400
+    return jsonify(report)
+
+
+@bp.route("/archive")
+def archived_tasks():
+    """
+    Return archived tasks in JSON format, most recently done first.
+
+    Query parameters:
+        user: Optional username of the task owner
+        category: Optional task category (ad-hoc, reg, pro)
+        cursor: Cursor returned with the previous page
+        limit: Page size (at most 100)
+
+    Returns:
+        JSON response with the tasks of the page and the cursor of the next page
+    """
+    if not session.get("logged_in"):
+        return jsonify({"error": "Not logged in"}), 401
+
+    limit = max(1, min(request.args.get("limit", 50, type=int), 100))
+    return handle_archive_page(
+        request.args.get("user"), request.args.get("category"), request.args.get("cursor"), limit
+    )
+
+
+@bp.route("/events")
+def change_events():
+    """
+    Stream task, vacation and user changes as Server-Sent Events.
+
+    The stream starts after the event given in the Last-Event-ID header
+    (sent by the browser on reconnect) or the ``after`` query parameter,
+    otherwise at the current end of the change log.
+
+    Returns:
+        Streaming response with the text/event-stream mimetype
+    """
+    if not session.get("logged_in"):
+        return jsonify({"error": "Not logged in"}), 401
+
+    last_id = request.headers.get("Last-Event-ID", type=int)
+    if last_id is None:
+        last_id = request.args.get("after", type=int)
+    resume = last_id is not None
+    if not resume:
+        last_id = events.get_latest_change_id()
+
+    poll_interval = float(os.environ.get("EVENTS_POLL_INTERVAL", 2))
+    return Response(
+        stream_with_context(stream_changes(last_id, poll_interval, resume=resume)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@bp.route("/availability")
+def get_availability():
+    """
+    Return per-day headcount of users out and available in JSON format.
+
+    Query parameters:
+        start: Period start (dd/mm/yyyy or yyyy-mm-dd), defaults to today
+        end: Period end (dd/mm/yyyy or yyyy-mm-dd), defaults to 90 days after start
+
+    Returns:
+        Columnar JSON response with team_size, days, out and available
+    """
+    if not session.get("logged_in"):
+        return redirect(url_for(".login"))
+
+    try:
+        start_date = parse_custom_date(request.args.get("start")) or date.today()
+        end_date = parse_custom_date(request.args.get("end")) or start_date + timedelta(days=90)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if end_date < start_date:
+        return jsonify({"error": "Period end is before its start"}), 400
+    if (end_date - start_date).days >= MAX_AVAILABILITY_DAYS:
+        return jsonify({"error": f"Period is longer than {MAX_AVAILABILITY_DAYS} days"}), 400
+
+    return compressed_json(availability.get_daily_headcount(start_date, end_date))
+
+
+@bp.route("/who_is_out")
+def who_is_out():
+    """
+    Return the users on vacation on a given day in JSON format.
+
+    Query parameters:
+        date: Day to check (dd/mm/yyyy or yyyy-mm-dd), defaults to today
+
+    Returns:
+        JSON response with the date and the list of usernames
+    """
+    if not session.get("logged_in"):
+        return redirect(url_for(".login"))
+
+    try:
+        day = parse_custom_date(request.args.get("date")) or date.today()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"date": day.isoformat(), "users": availability.get_users_out(day)})
+
+
+def check_vacation_conflicts(start_date, end_date, username=None, vacation_id=None):
+    """
+    Flash messages about vacations overlapping the given period.
+
+    :param start_date: Start date of the vacation.
+    :param end_date: End date of the vacation.
+    :param username: Owner of a new vacation.
+    :param vacation_id: ID of an edited vacation.
+    :return: True if the period is valid and does not overlap another
+             vacation of the same user, False otherwise.
+    """
+    if end_date < start_date:
+        flash("Vacation end date is before its start date.", "error")
+        return False
+
+    own, others = availability.find_vacation_conflicts(start_date, end_date, username, vacation_id)
+    if own:
+        periods = ", ".join(f"{start:%d.%m.%Y} - {end:%d.%m.%Y}" for start, end in own)
+        flash(f"This vacation overlaps another vacation of the same user: {periods}", "error")
+        return False
+    if others:
+        flash(f"Also out during this period: {', '.join(others)}", "info")
+    return True
+
+
+@bp.route("/delete_vacation", methods=["POST"])
 def delete_vacation():
     """
     Delete vacation from database
@@ -153,17 +542,17 @@ def delete_vacation():
         Redirect to index page
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     vacation_id = int(request.form.get("vacation_id"))
     user = request.form.get("user")
     view = request.form.get("view", "vacation")
 
     svc.delete_vacation(vacation_id)
-    return redirect(url_for("index", user=user, view=view))
+    return redirect(url_for(".index", user=user, view=view))
 
 
-@app.route("/add_vacation", methods=["POST"])
+@bp.route("/add_vacation", methods=["POST"])
 def add_vacation_route():
     """
     Add new vacation
@@ -172,7 +561,7 @@ def add_vacation_route():
         Redirect to index page
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     user_name = request.form.get("user")
     start_date_str = request.form.get("start_date")
@@ -182,16 +571,17 @@ def add_vacation_route():
 
     if not start_date_str or not end_date_str:
         flash("Please enter both start and end dates for vacation.", "error")
-        return redirect(url_for("index", user=user_name, view="vacation"))
+        return redirect(url_for(".index", user=user_name, view="vacation"))
 
     start_date = parse_custom_date(start_date_str)
     end_date = parse_custom_date(end_date_str)
 
-    svc.add_vacation(user_name, start_date, end_date, comment, status)
-    return redirect(url_for("index", user=user_name, view="vacation"))
+    if check_vacation_conflicts(start_date, end_date, username=user_name):
+        svc.add_vacation(user_name, start_date, end_date, comment, status)
+    return redirect(url_for(".index", user=user_name, view="vacation"))
 
 
-@app.route("/delete_vacation/<int:vacation_id>")
+@bp.route("/delete_vacation/<int:vacation_id>")
 def delete_vacation_route(vacation_id):
     """
     Delete vacation by ID
@@ -203,10 +593,10 @@ def delete_vacation_route(vacation_id):
         Redirect to index page
     """
     svc.delete_vacation(vacation_id)
-    return redirect(url_for("index", view="vacation"))
+    return redirect(url_for(".index", view="vacation"))
 
 
-@app.route("/add", methods=["POST"])
+@bp.route("/add", methods=["POST"])
 def add_task():
     """
     Add a new task for the selected user.
@@ -217,19 +607,19 @@ def add_task():
         or no valid user was provided.
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     selected_user = request.form.get("user")
     title = request.form.get("task_title")
     view = request.form.get("view", "users")
 
-    if not selected_user or selected_user == "all" or not svc.User.query.filter_by(username=selected_user).first():
+    if not selected_user or selected_user == "all" or svc.get_user_id(selected_user) is None:
         flash("Please select a specific user to add tasks.", "error")
         if view == "users":
-            users = [u.username for u in svc.User.query.all()]
+            users = svc.get_usernames()
             if users:
-                return redirect(url_for("index", user=users[0], view=view))
-        return redirect(url_for("index", view=view))
+                return redirect(url_for(".index", user=users[0], view=view))
+        return redirect(url_for(".index", view=view))
 
     status = request.form.get("status", "todo")
     task_type = request.form.get("type", "task")
@@ -257,10 +647,10 @@ def add_task():
             comment
         )
 
-    return redirect(url_for("index", user=selected_user, view=view))
+    return redirect(url_for(".index", user=selected_user, view=view))
 
 
-@app.route("/edit_vacation", methods=["POST"])
+@bp.route("/edit_vacation", methods=["POST"])
 def edit_vacation():
     """
     Edit existing vacation
@@ -269,7 +659,7 @@ def edit_vacation():
         Redirect to index page
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     vacation_id = int(request.form.get("vacation_id"))
     status = request.form.get("status")
@@ -279,12 +669,13 @@ def edit_vacation():
 
     user = request.form.get("user", "all")
 
-    svc.edit_vacation(vacation_id, status, start_date, end_date, comment)
+    if check_vacation_conflicts(start_date, end_date, vacation_id=vacation_id):
+        svc.edit_vacation(vacation_id, status, start_date, end_date, comment)
 
-    return redirect(url_for("index", user=user, view="vacation"))
+    return redirect(url_for(".index", user=user, view="vacation"))
 
 
-@app.route("/edit_task", methods=["POST"])
+@bp.route("/edit_task", methods=["POST"])
 def edit_task():
     """
     Edit an existing task in the database based on the sidebar form submission.
@@ -292,7 +683,7 @@ def edit_task():
     :return: Redirect to index page with updated task data.
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     user = request.form.get("user")
     task_id = int(request.form.get("task_id"))
@@ -318,10 +709,43 @@ def edit_task():
         }
     )
 
-    return redirect(url_for("index", user=user, view=view))
+    return redirect(url_for(".index", user=user, view=view))
+
+
+@bp.route("/task/<int:task_id>", methods=["GET"])
+def get_task(task_id):
+    """
+    Return the full data of a task in JSON format, loaded when its card is opened.
+
+    :param task_id: ID of the task.
+    :return: JSON with the task, or an error with status 404.
+    """
+    if not session.get("logged_in"):
+        return jsonify({"error": "Not logged in"}), 401
+
+    return handle_task_details(task_id)
+
+
+@bp.route("/task/<int:task_id>", methods=["PATCH", "POST"])
+def update_task(task_id):
+    """
+    Update a task in place, e.g. after dragging it to another column.
+
+    Accepts a JSON body or form data with any of the task fields
+    (title, status, type, priority, start_date, deadline, tags, task_type, comment).
+    Only the given fields are changed.
+
+    :param task_id: ID of the task to update.
+    :return: JSON with the updated card, or an error with status 400/404.
+    """
+    if not session.get("logged_in"):
+        return jsonify({"error": "Not logged in"}), 401
+
+    data = request.get_json(silent=True) or request.form.to_dict()
+    return handle_task_update(task_id, data)
 
 
-@app.route("/delete_task", methods=["POST"])
+@bp.route("/delete_task", methods=["POST"])
 def delete_task():
     """
     Delete a task from the database.
@@ -329,14 +753,18 @@ def delete_task():
     :return: Redirect to index page with updated tasks.
     """
     if not session.get("logged_in"):
-        return redirect(url_for("login"))
+        return redirect(url_for(".login"))
 
     task_id = int(request.form.get("task_id"))
     user = request.form.get("user")
     view = request.form.get("view", "users")
     svc.delete_task_from_db(task_id)
-    return redirect(url_for("index", user=user, view=view))
+    return redirect(url_for(".index", user=user, view=view))
 
 
 if __name__ == "__main__":
+    app = create_app()
+    # Development server: create or upgrade the schema on start
+    with app.app_context():
+        setup_database()
     app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
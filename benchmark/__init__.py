@@ -0,0 +1,8 @@
+"""
+Load-testing benchmark of the kanban views.
+
+Seeds a throwaway database with synthetic data, drives every route of
+``app.py`` with the Flask test client (sequentially and with concurrent
+clients) and reports latency percentiles, SQL statements and peak memory
+per view. Run with ``python -m benchmark --help``.
+"""
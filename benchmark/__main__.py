@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import tempfile
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Benchmark the kanban views.")
+    parser.add_argument("--users", type=int, default=20, help="Number of seeded users (default: 20)")
+    parser.add_argument("--tasks", type=int, default=20000, help="Number of seeded tasks (default: 20000)")
+    parser.add_argument("--vacations", type=int, default=500, help="Number of seeded vacations (default: 500)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic data (default: 0)")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per view and phase (default: 50)")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent clients for read-only views (default: 4)")
+    parser.add_argument("--view", action="append", dest="views", help="Run only this view (repeatable)")
+    parser.add_argument("--cold", action="store_true", help="Disable the board render cache")
+    parser.add_argument("--snapshot", metavar="PATH",
+                        help="Load this snapshot (flask snapshot) instead of seeding synthetic data")
+    parser.add_argument("--database-url", help="Empty database to use instead of a temporary SQLite file")
+    parser.add_argument("--save", metavar="PATH", help="Write the results to a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare with a JSON baseline, exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative growth of p95 latency when comparing (default: 0.2)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # The app reads its configuration at import time
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/benchmark.db"
+    os.environ.pop("DATABASE_READ_URL", None)
+    if args.cold:
+        os.environ["RENDER_CACHE_SIZE"] = "0"
+
+    from wsgi import app
+    from models.cli import setup_database
+    from models.cache import get_usernames
+    from models.snapshot import restore_snapshot
+    from benchmark.seed import seed
+    from benchmark import runner
+
+    unknown = set(args.views or []) - set(runner.SCENARIOS)
+    if unknown:
+        sys.exit(f"Unknown views: {', '.join(sorted(unknown))}. Available: {', '.join(runner.SCENARIOS)}")
+
+    with app.app_context():
+        setup_database()
+        if args.snapshot:
+            counts = restore_snapshot(args.snapshot)
+            usernames = get_usernames()
+            seeded = {"snapshot": os.path.basename(args.snapshot), "users": counts["user"],
+                      "tasks": counts["task"], "vacations": counts["vacation"]}
+        else:
+            seeded = seed(args.users, args.tasks, args.vacations, args.seed)
+            usernames = seeded.pop("usernames")
+    print(f"Loaded {seeded['users']} users, {seeded['tasks']} tasks, {seeded['vacations']} vacations")
+
+    results = runner.run(usernames, seeded, args.views, args.requests, args.clients)
+
+    if args.save:
+        runner.save(results, args.save)
+        print(f"Saved results to {args.save}")
+
+    if args.compare:
+        regressions = runner.compare(runner.load(args.compare), results, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
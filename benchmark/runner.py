@@ -0,0 +1,286 @@
+import io
+import json
+import platform
+import statistics
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from wsgi import app
+from models.cache import render_cache
+from models.models import db, Task, Vacation
+
+
+class Context:
+    """
+    Data shared by the scenarios: seeded usernames and IDs that mutations may consume.
+
+    Attributes:
+        usernames (list[str]): Seeded usernames.
+        task_ids (list[int]): IDs of tasks that delete scenarios may remove.
+        vacation_ids (list[int]): IDs of vacations that delete scenarios may remove.
+    """
+
+    def __init__(self, usernames):
+        self.usernames = usernames
+        with app.app_context():
+            self.task_ids = db.session.scalars(db.select(Task.id).order_by(Task.id.desc())).all()
+            self.vacation_ids = db.session.scalars(db.select(Vacation.id).order_by(Vacation.id.desc())).all()
+        self._lock = threading.Lock()
+
+    def user(self, i):
+        return self.usernames[i % len(self.usernames)]
+
+    def pop_task(self):
+        with self._lock:
+            return self.task_ids.pop(0)
+
+    def pop_vacation(self):
+        with self._lock:
+            return self.vacation_ids.pop(0)
+
+
+def _today(offset=0):
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+def _import_file(ctx, i, rows=20):
+    lines = ["username,title,status,tags,task_type"]
+    lines += [f"{ctx.user(i + n)},Imported task {i}-{n},todo,bench,REG" for n in range(rows)]
+    return io.BytesIO("\n".join(lines).encode()), "bench.csv"
+
+
+# name: (method, function building the URL and request arguments, safe to run concurrently)
+# The events stream is left out: it is a long-lived response, not a request/response view.
+SCENARIOS = {
+    "login_page": ("GET", lambda ctx, i: ("/login", {}), True),
+    "login": ("POST", lambda ctx, i: ("/login", {"data": {
+        "username": app.config["APP_USERNAME"], "password": app.config["APP_PASSWORD"]
+    }}), True),
+    "logout": ("GET", lambda ctx, i: ("/logout", {}), True),
+    "index_users": ("GET", lambda ctx, i: ("/", {"query_string": {"view": "users", "user": ctx.user(i)}}), True),
+    "index_ad-hoc": ("GET", lambda ctx, i: ("/", {"query_string": {"view": "ad-hoc", "user": "all"}}), True),
+    "index_reg": ("GET", lambda ctx, i: ("/", {"query_string": {"view": "reg", "user": ctx.user(i)}}), True),
+    "index_pro": ("GET", lambda ctx, i: ("/", {"query_string": {"view": "pro", "user": "all"}}), True),
+    "index_backlog": ("GET", lambda ctx, i: ("/", {"query_string": {"view": "backlog"}}), True),
+    "index_vacation": ("GET", lambda ctx, i: ("/", {"query_string": {"view": "vacation", "user": "all"}}), True),
+    "index_tag": ("GET", lambda ctx, i: ("/", {"query_string": {"view": "backlog", "tag": "ops"}}), True),
+    "summary": ("GET", lambda ctx, i: ("/summary", {}), True),
+    "flow_metrics": ("GET", lambda ctx, i: ("/flow_metrics", {}), True),
+    "render_cache_stats": ("GET", lambda ctx, i: ("/render_cache_stats", {}), True),
+    "metrics": ("GET", lambda ctx, i: ("/metrics", {}), True),
+    "get_vacations_data": ("GET", lambda ctx, i: (
+        "/get_vacations_data", {"query_string": {"start": _today(-90), "end": _today(90)}}
+    ), True),
+    "get_board_page": ("GET", lambda ctx, i: (
+        "/get_board_page", {"query_string": {"view": "backlog", "status": "done"}}
+    ), True),
+    "get_task": ("GET", lambda ctx, i: (f"/task/{ctx.task_ids[-1 - i % 100]}", {}), True),
+    "export_csv": ("GET", lambda ctx, i: ("/export", {"query_string": {"view": "backlog"}}), True),
+    "export_jsonl": ("GET", lambda ctx, i: (
+        "/export", {"query_string": {"view": "reg", "user": ctx.user(i), "format": "jsonl"}}
+    ), True),
+    "archive": ("GET", lambda ctx, i: ("/archive", {"query_string": {"user": ctx.user(i)}}), True),
+    "search": ("GET", lambda ctx, i: ("/search", {"query_string": {"q": "deploy rev"}}), True),
+    "availability": ("GET", lambda ctx, i: ("/availability", {}), True),
+    "who_is_out": ("GET", lambda ctx, i: ("/who_is_out", {}), True),
+    "add_task": ("POST", lambda ctx, i: ("/add", {"data": {
+        "user": ctx.user(i), "task_title": f"Benchmark task {i}", "tags": "bench,ops", "task_type": "REG"
+    }}), False),
+    "patch_task": ("PATCH", lambda ctx, i: (
+        f"/task/{ctx.task_ids[-1 - i % 100]}", {"json": {"status": ["todo", "in_progress", "done"][i % 3]}}
+    ), False),
+    "edit_task": ("POST", lambda ctx, i: ("/edit_task", {"data": {
+        "task_id": ctx.task_ids[-1 - i % 100], "user": ctx.user(i), "title": f"Edited {i}", "status": "waiting",
+        "type": "task", "priority": "low", "start_date": _today(), "tags": "bench", "task_type": "PRO"
+    }}), False),
+    "delete_task": ("POST", lambda ctx, i: ("/delete_task", {"data": {"task_id": ctx.pop_task()}}), False),
+    "add_vacation": ("POST", lambda ctx, i: ("/add_vacation", {"data": {
+        "user": ctx.user(i), "start_date": _today(400 + i * 30), "end_date": _today(405 + i * 30)
+    }}), False),
+    "edit_vacation": ("POST", lambda ctx, i: ("/edit_vacation", {"data": {
+        "vacation_id": ctx.vacation_ids[-1 - i % 100], "status": "done",
+        "start_date": _today(-800 - i * 30), "end_date": _today(-795 - i * 30)
+    }}), False),
+    "delete_vacation": ("POST", lambda ctx, i: ("/delete_vacation", {"data": {"vacation_id": ctx.pop_vacation()}}), False),
+    "delete_vacation_link": ("GET", lambda ctx, i: (f"/delete_vacation/{ctx.pop_vacation()}", {}), False),
+    "import": ("POST", lambda ctx, i: ("/import", {"data": {"file": _import_file(ctx, i)}}), False),
+    "add_user": ("POST", lambda ctx, i: ("/add_user", {"data": {"username": f"bench_user_{i}"}}), False),
+    "delete_user": ("GET", lambda ctx, i: (f"/delete_user/bench_user_{i}", {}), False),
+}
+
+
+def _client():
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["logged_in"] = True
+    return client
+
+
+def _send(client, method, url, kwargs):
+    """
+    Send one request.
+
+    :return: Tuple of (latency in seconds, number of SQL statements, status code).
+    """
+    start = time.perf_counter()
+    response = client.open(url, method=method, **kwargs)
+    # Streamed responses (exports) are produced while the body is read
+    response.get_data()
+    latency = time.perf_counter() - start
+    response.close()
+    return latency, int(response.headers.get("X-SQL-Queries", 0)), response.status_code
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+def _summarize(latencies):
+    return {
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2)
+    }
+
+
+def run_scenario(ctx, name, requests=50, clients=4):
+    """
+    Measure one scenario: sequential latency, SQL statements and peak memory,
+    then latency and throughput with concurrent clients for read-only views.
+
+    :param ctx: Context with the seeded data.
+    :param name: Key of SCENARIOS.
+    :param requests: Number of requests per phase.
+    :param clients: Number of concurrent clients.
+    :return: Dictionary with the measurements.
+    """
+    method, build, concurrent = SCENARIOS[name]
+    client = _client()
+
+    # Memory is measured on a separate request, tracing slows everything down
+    url, kwargs = build(ctx, 0)
+    tracemalloc.start()
+    _send(client, method, url, kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies, queries, statuses = [], [], set()
+    for i in range(1, requests + 1):
+        url, kwargs = build(ctx, i)
+        latency, count, status = _send(client, method, url, kwargs)
+        latencies.append(latency)
+        queries.append(count)
+        statuses.add(status)
+
+    result = {
+        "method": method,
+        "status": sorted(statuses),
+        **_summarize(latencies),
+        "sql_queries": round(statistics.fmean(queries), 1),
+        "peak_memory_kib": round(peak / 1024, 1)
+    }
+
+    if concurrent and clients > 1:
+        local = threading.local()
+
+        def worker(i):
+            if not hasattr(local, "client"):
+                local.client = _client()
+            url, kwargs = build(ctx, i)
+            return _send(local.client, method, url, kwargs)[0]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(clients) as pool:
+            concurrent_latencies = list(pool.map(worker, range(requests)))
+        elapsed = time.perf_counter() - start
+        result["concurrent"] = {
+            "clients": clients,
+            **_summarize(concurrent_latencies),
+            "requests_per_second": round(requests / elapsed, 1)
+        }
+
+    return result
+
+
+def run(usernames, seeded, names=None, requests=50, clients=4):
+    """
+    Run the scenarios and collect the results in a baseline document.
+
+    :param usernames: Seeded usernames.
+    :param seeded: Data volumes, stored with the results.
+    :param names: Scenario names to run, all by default.
+    :param requests: Number of requests per phase.
+    :param clients: Number of concurrent clients.
+    :return: Dictionary with the environment and the results per scenario.
+    """
+    ctx = Context(usernames)
+    views = {}
+    for name in names or SCENARIOS:
+        views[name] = run_scenario(ctx, name, requests, clients)
+        view = views[name]
+        print(
+            f"{name:20} p50 {view['p50_ms']:8.2f} ms  p95 {view['p95_ms']:8.2f} ms  p99 {view['p99_ms']:8.2f} ms"
+            f"  sql {view['sql_queries']:5}  peak {view['peak_memory_kib']:9.1f} KiB"
+            + (f"  x{clients} p95 {view['concurrent']['p95_ms']:8.2f} ms"
+               f" {view['concurrent']['requests_per_second']:7.1f} req/s" if "concurrent" in view else "")
+        )
+
+    with app.app_context():
+        dialect = db.engine.dialect.name
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "database": dialect,
+        "seed": seeded,
+        "requests": requests,
+        "clients": clients,
+        "render_cache_size": render_cache.max_entries,
+        "views": views
+    }
+
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Compare results with a saved baseline.
+
+    A view regresses when its p95 latency grows by more than ``threshold``
+    (relative) or it sends more SQL statements than before.
+
+    :param baseline: Saved baseline document.
+    :param current: Document returned by run().
+    :param threshold: Allowed relative growth of the p95 latency.
+    :return: List of regression messages.
+    """
+    regressions = []
+    for name, view in current["views"].items():
+        old = baseline.get("views", {}).get(name)
+        if not old:
+            continue
+        if view["p95_ms"] > old["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {old['p95_ms']} ms -> {view['p95_ms']} ms")
+        if view["sql_queries"] > old["sql_queries"]:
+            regressions.append(f"{name}: SQL statements {old['sql_queries']} -> {view['sql_queries']}")
+    return regressions
+
+
+def save(results, path):
+    """
+    Write results to a JSON file.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load(path):
+    """
+    Read results from a JSON file.
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,91 @@
+import random
+from datetime import date, timedelta
+from models.models import db, User, Task, Vacation, migrate_tags, migrate_transitions
+from models.search import rebuild_search_index
+from models.utils import STATUSES
+
+TYPES = ["task", "ASAP"]
+PRIORITIES = ["blocker", "critical", "medium", "low", "minor"]
+CATEGORIES = ["AD-HOC", "REG", "PRO"]
+TAGS = ["backend", "frontend", "ops", "docs", "bug", "release", "client", "report", "infra", "qa"]
+WORDS = [
+    "deploy", "review", "update", "report", "migrate", "fix", "design", "meeting",
+    "invoice", "backup", "release", "audit", "dashboard", "import", "export", "server"
+]
+
+
+def _rows(count, batch_size, make_row):
+    """
+    Split the rows of a bulk insert into batches.
+
+    :param count: Total number of rows.
+    :param batch_size: Number of rows per batch.
+    :param make_row: Function building the row with the given index.
+    :return: Generator of lists of rows.
+    """
+    for start in range(0, count, batch_size):
+        yield [make_row(i) for i in range(start, min(start + batch_size, count))]
+
+
+def seed(users=20, tasks=20000, vacations=500, random_seed=0, batch_size=5000):
+    """
+    Fill an empty database with synthetic users, tasks and vacations.
+
+    Rows are inserted in batches with executemany, then the derived data
+    (tag tables, status history, search index) is built the same way
+    ``upgrade-db`` builds it for existing databases. The same random seed
+    always produces the same data.
+
+    Must be called inside an application context.
+
+    :param users: Number of users.
+    :param tasks: Number of tasks, spread over all users.
+    :param vacations: Number of vacations, spread over all users.
+    :param random_seed: Seed of the random generator.
+    :param batch_size: Number of rows per INSERT batch.
+    :return: Dictionary with the usernames and the number of rows per table.
+    """
+    rng = random.Random(random_seed)
+    today = date.today()
+    usernames = [f"user{i:03}" for i in range(users)]
+
+    db.session.execute(db.insert(User), [{"username": name} for name in usernames])
+    user_ids = db.session.scalars(db.select(User.id).order_by(User.id)).all()
+
+    def make_task(i):
+        start_date = today - timedelta(days=rng.randrange(365))
+        return {
+            "title": " ".join(rng.choices(WORDS, k=3)).capitalize() + f" #{i}",
+            "status": rng.choice(STATUSES),
+            "type": rng.choice(TYPES),
+            "priority": rng.choice(PRIORITIES),
+            "start_date": start_date,
+            "deadline": start_date + timedelta(days=rng.randrange(1, 60)) if rng.random() < 0.5 else None,
+            "tags": ",".join(rng.sample(TAGS, rng.randrange(4))),
+            "task_type": rng.choice(CATEGORIES),
+            "status_date": today - timedelta(days=rng.randrange(60)),
+            "user_id": rng.choice(user_ids),
+            "comment": " ".join(rng.choices(WORDS, k=rng.randrange(20)))
+        }
+
+    def make_vacation(i):
+        start_date = today + timedelta(days=rng.randrange(-180, 180))
+        return {
+            "user_id": rng.choice(user_ids),
+            "start_date": start_date,
+            "end_date": start_date + timedelta(days=rng.randrange(1, 15)),
+            "status": rng.choice(STATUSES),
+            "comment": ""
+        }
+
+    for batch in _rows(tasks, batch_size, make_task):
+        db.session.execute(db.insert(Task), batch)
+    for batch in _rows(vacations, batch_size, make_vacation):
+        db.session.execute(db.insert(Vacation), batch)
+    db.session.commit()
+
+    migrate_tags()
+    migrate_transitions()
+    rebuild_search_index()
+
+    return {"usernames": usernames, "users": users, "tasks": tasks, "vacations": vacations}
@@ -0,0 +1,21 @@
+import os
+from models.models import dispose_engines
+
+# gunicorn -c gunicorn.conf.py wsgi:app
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * os.cpu_count() + 1))
+
+# Live board streams (/events) keep a connection open, so every worker serves several at once
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# The app is imported once in the master and forked, so workers start without importing it again
+preload_app = True
+
+
+def post_fork(server, worker):
+    """
+    Give every worker its own database connections instead of the ones inherited from the master.
+    """
+    from wsgi import app
+    dispose_engines(app)
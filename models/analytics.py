@@ -0,0 +1,141 @@
+from datetime import date, datetime, time, timedelta
+from models.models import db, Task, TaskTransition
+from models.cache import get_user_ids
+
+WIP_STATUSES = ["in_progress", "waiting"]
+
+
+def _days_between(later, earlier):
+    """
+    Build a dialect-aware SQL expression for the number of days between two dates or timestamps.
+
+    :param later: Later date/timestamp column or expression.
+    :param earlier: Earlier date/timestamp column or expression.
+    :return: SQL expression with a fractional number of days.
+    """
+    if db.session.get_bind().dialect.name == "sqlite":
+        return db.func.julianday(later) - db.func.julianday(earlier)
+    return db.func.extract(
+        "epoch", db.cast(later, db.DateTime) - db.cast(earlier, db.DateTime)
+    ) / 86400
+
+
+def _username(usernames, user_id):
+    """
+    Get the username of a user ID, falling back to the ID for deleted users.
+    """
+    return usernames.get(user_id, str(user_id))
+
+
+def get_flow_metrics(start_date, end_date):
+    """
+    Compute throughput, lead time, cycle time and aging WIP per user and category.
+
+    Everything is computed in the database:
+
+    - Throughput counts the tasks that moved to done in the period.
+    - For those tasks, window functions over their transitions find when
+      they were created (first transition) and first started
+      (first move to in_progress). Lead time is created -> done, cycle
+      time is started -> done.
+    - Aging WIP is the number of tasks currently in progress or waiting
+      and how long they have been in that status.
+
+    Only the transitions of tasks finished in the period are read, through
+    the (to_status, changed_at) and (task_id, changed_at) indexes, so the
+    cost does not grow with the length of the history.
+
+    :param start_date: First day of the period.
+    :param end_date: Last day of the period.
+    :return: Dictionary with the period, a list of throughput/cycle time
+             groups and a list of aging WIP groups.
+    """
+    period_start = datetime.combine(start_date, time.min)
+    period_end = datetime.combine(end_date + timedelta(days=1), time.min)
+
+    finished_ids = (
+        db.select(TaskTransition.task_id)
+        .where(
+            TaskTransition.to_status == "done",
+            TaskTransition.changed_at >= period_start,
+            TaskTransition.changed_at < period_end
+        )
+    )
+    history = (
+        db.select(
+            TaskTransition.task_id,
+            TaskTransition.user_id,
+            TaskTransition.task_type,
+            TaskTransition.to_status,
+            TaskTransition.changed_at,
+            db.func.min(TaskTransition.changed_at).over(
+                partition_by=TaskTransition.task_id
+            ).label("created_at"),
+            db.func.min(db.case(
+                (TaskTransition.to_status == "in_progress", TaskTransition.changed_at)
+            )).over(partition_by=TaskTransition.task_id).label("started_at")
+        )
+        .where(TaskTransition.task_id.in_(finished_ids))
+        .subquery()
+    )
+    lead_time = _days_between(history.c.changed_at, history.c.created_at)
+    cycle_time = _days_between(history.c.changed_at, history.c.started_at)
+    flow_query = (
+        db.select(
+            history.c.user_id,
+            history.c.task_type,
+            db.func.count(db.distinct(history.c.task_id)),
+            db.func.avg(lead_time),
+            db.func.avg(cycle_time),
+            db.func.max(cycle_time)
+        )
+        .where(
+            history.c.to_status == "done",
+            history.c.changed_at >= period_start,
+            history.c.changed_at < period_end
+        )
+        .group_by(history.c.user_id, history.c.task_type)
+    )
+
+    today = date.today()
+    age = _days_between(db.literal(today, db.Date), Task.status_date)
+    wip_query = (
+        db.select(Task.user_id, Task.task_type, Task.status, db.func.count(Task.id), db.func.avg(age), db.func.max(age))
+        .where(Task.status.in_(WIP_STATUSES))
+        .group_by(Task.user_id, Task.task_type, Task.status)
+    )
+
+    usernames = {user_id: name for name, user_id in get_user_ids().items()}
+
+    def rounded(value):
+        return round(float(value), 2) if value is not None else None
+
+    flow = [
+        {
+            "user": _username(usernames, user_id),
+            "category": task_type,
+            "throughput": throughput,
+            "avg_lead_time_days": rounded(avg_lead),
+            "avg_cycle_time_days": rounded(avg_cycle),
+            "max_cycle_time_days": rounded(max_cycle)
+        }
+        for user_id, task_type, throughput, avg_lead, avg_cycle, max_cycle in db.session.execute(flow_query)
+    ]
+    aging_wip = [
+        {
+            "user": _username(usernames, user_id),
+            "category": task_type,
+            "status": status,
+            "count": count,
+            "avg_age_days": rounded(avg_age),
+            "max_age_days": rounded(max_age)
+        }
+        for user_id, task_type, status, count, avg_age, max_age in db.session.execute(wip_query)
+    ]
+
+    return {
+        "start": start_date.isoformat(),
+        "end": end_date.isoformat(),
+        "flow": flow,
+        "aging_wip": aging_wip
+    }
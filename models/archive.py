@@ -0,0 +1,117 @@
+from datetime import date, datetime, timedelta
+from sqlalchemy import and_, or_
+from models.models import db, User, Task, TaskArchive, task_tag
+from models.events import record_change
+from models.search import unindex_tasks
+from models.cache import BOARD_VERSION, bump_version, get_user_id
+
+
+def archive_done_tasks(days, batch_size=1000):
+    """
+    Move tasks that have been done for more than ``days`` days to the archive.
+
+    Tasks are moved in batches of ``batch_size``: each batch is copied with
+    an INSERT ... SELECT, its tag links and search entries are removed, the
+    tasks are deleted and the batch is committed. Open boards get a delete
+    event per task. The status history of the tasks is kept.
+
+    The candidates are found through the (status, status_date, id) index,
+    so every batch costs the same regardless of the size of the table.
+
+    Must be called inside an application context.
+
+    :param days: Minimum number of days in the done column.
+    :param batch_size: Number of tasks moved per transaction.
+    :return: Number of archived tasks.
+    """
+    cutoff = date.today() - timedelta(days=days)
+    columns = [
+        "id", "title", "status", "type", "priority", "start_date", "deadline", "tags",
+        "task_type", "status_date", "user_id", "username", "comment", "archived_at"
+    ]
+    archived = 0
+
+    while True:
+        task_ids = db.session.scalars(
+            db.select(Task.id)
+            .where(Task.status == "done", Task.status_date < cutoff)
+            .order_by(Task.status_date, Task.id)
+            .limit(batch_size)
+        ).all()
+        if not task_ids:
+            break
+
+        db.session.execute(db.insert(TaskArchive).from_select(
+            columns,
+            db.select(
+                Task.id, Task.title, Task.status, Task.type, Task.priority, Task.start_date, Task.deadline,
+                Task.tags, Task.task_type, Task.status_date, Task.user_id, User.username, Task.comment,
+                db.literal(datetime.utcnow(), db.DateTime)
+            )
+            .outerjoin(User, Task.user_id == User.id)
+            .where(Task.id.in_(task_ids))
+        ))
+        db.session.execute(db.delete(task_tag).where(task_tag.c.task_id.in_(task_ids)))
+        db.session.execute(db.delete(Task).where(Task.id.in_(task_ids)))
+        unindex_tasks(task_ids)
+        for task_id in task_ids:
+            record_change("task", task_id, "delete")
+        bump_version(BOARD_VERSION)
+        db.session.commit()
+
+        archived += len(task_ids)
+        if len(task_ids) < batch_size:
+            break
+
+    return archived
+
+
+def get_archive_page(username=None, category=None, after=None, limit=50):
+    """
+    Retrieve one page of archived tasks, most recently done first.
+
+    Uses keyset pagination on ``(status_date, id)`` like the board columns.
+
+    :param username: Optional username of the task owner to filter by.
+    :param category: Optional task category (AD-HOC, PRO, REG) to filter by.
+    :param after: Optional ``(status_date, id)`` tuple of the last task already shown.
+    :param limit: Maximum number of tasks to return.
+    :return: Tuple of (list of archived task rows, ``(status_date, id)`` cursor
+             of the next page or None if this is the last page).
+    """
+    query = db.select(
+        TaskArchive.id,
+        TaskArchive.title,
+        TaskArchive.status,
+        TaskArchive.type,
+        TaskArchive.priority,
+        TaskArchive.start_date,
+        TaskArchive.deadline,
+        TaskArchive.tags,
+        TaskArchive.task_type,
+        TaskArchive.status_date,
+        TaskArchive.comment,
+        TaskArchive.username,
+        TaskArchive.archived_at
+    )
+    if username:
+        user_id = get_user_id(username)
+        query = query.where(
+            TaskArchive.user_id == user_id if user_id is not None else TaskArchive.username == username
+        )
+    if category:
+        query = query.where(TaskArchive.task_type == category)
+    if after:
+        after_date, after_id = after
+        query = query.where(or_(
+            TaskArchive.status_date < after_date,
+            and_(TaskArchive.status_date == after_date, TaskArchive.id < after_id)
+        ))
+
+    query = query.order_by(TaskArchive.status_date.desc(), TaskArchive.id.desc()).limit(limit + 1)
+    tasks = db.session.execute(query).all()
+    if len(tasks) <= limit:
+        return tasks, None
+
+    tasks = tasks[:limit]
+    return tasks, (tasks[-1].status_date, tasks[-1].id)
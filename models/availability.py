@@ -0,0 +1,121 @@
+from datetime import timedelta
+from itertools import groupby
+from models.models import db, User, Vacation
+from models.cache import get_user_id, get_usernames
+
+
+def _overlapping(query, start_date, end_date):
+    """
+    Restrict a vacation query to vacations overlapping a date range.
+
+    Both bounds are inclusive. The end_date bound lets the database use the
+    (end_date, start_date) index, so ranges close to today only touch the
+    few vacations that have not ended yet.
+
+    :param query: Select statement over the vacation table.
+    :param start_date: First day of the range.
+    :param end_date: Last day of the range.
+    :return: Filtered select statement.
+    """
+    return query.where(Vacation.end_date >= start_date, Vacation.start_date <= end_date)
+
+
+def get_users_out(day):
+    """
+    Get the users who are on vacation on a given day.
+
+    :param day: Date to check.
+    :return: Sorted list of usernames.
+    """
+    query = db.select(User.username).join(Vacation, Vacation.user_id == User.id).distinct()
+    return sorted(db.session.execute(_overlapping(query, day, day)).scalars())
+
+
+def get_daily_headcount(start_date, end_date):
+    """
+    Count how many users are out and available on every day of a range.
+
+    The vacations overlapping the range are loaded in one indexed query,
+    ordered by user and start date. Overlapping vacations of the same user
+    are merged so that nobody is counted twice, then a sweep line over the
+    interval boundaries produces the per-day counts in
+    O(vacations + days).
+
+    :param start_date: First day of the range.
+    :param end_date: Last day of the range.
+    :return: Dictionary with team_size and the lists days, out and available.
+    """
+    days = (end_date - start_date).days + 1
+    query = _overlapping(
+        db.select(Vacation.user_id, Vacation.start_date, Vacation.end_date),
+        start_date, end_date
+    ).order_by(Vacation.user_id, Vacation.start_date)
+    rows = db.session.execute(query).all()
+
+    delta = [0] * (days + 1)
+    for _, intervals in groupby(rows, key=lambda row: row.user_id):
+        current_start = current_end = None
+        for _, start, end in intervals:
+            start = max(start, start_date)
+            end = min(end, end_date)
+            if current_end is not None and start <= current_end + timedelta(days=1):
+                current_end = max(current_end, end)
+                continue
+            if current_end is not None:
+                delta[(current_start - start_date).days] += 1
+                delta[(current_end - start_date).days + 1] -= 1
+            current_start, current_end = start, end
+        if current_end is not None:
+            delta[(current_start - start_date).days] += 1
+            delta[(current_end - start_date).days + 1] -= 1
+
+    team_size = len(get_usernames())
+    out = []
+    running = 0
+    for i in range(days):
+        running += delta[i]
+        out.append(running)
+
+    return {
+        "team_size": team_size,
+        "days": [(start_date + timedelta(days=i)).isoformat() for i in range(days)],
+        "out": out,
+        "available": [team_size - count for count in out]
+    }
+
+
+def find_vacation_conflicts(start_date, end_date, username=None, vacation_id=None):
+    """
+    Find vacations that overlap a new or edited vacation.
+
+    :param start_date: Start date of the vacation.
+    :param end_date: End date of the vacation.
+    :param username: Owner of a new vacation.
+    :param vacation_id: ID of an edited vacation; its owner is used and the
+                        vacation itself is not reported as a conflict.
+    :return: Tuple of (list of (start_date, end_date) of overlapping vacations
+             of the same user, sorted list of other users out in that period).
+    """
+    if vacation_id is not None:
+        user_id = db.session.execute(
+            db.select(Vacation.user_id).where(Vacation.id == vacation_id)
+        ).scalar()
+    else:
+        user_id = get_user_id(username)
+
+    query = _overlapping(
+        db.select(Vacation.id, Vacation.user_id, Vacation.start_date, Vacation.end_date, User.username)
+        .join(User, Vacation.user_id == User.id),
+        start_date, end_date
+    ).order_by(Vacation.start_date)
+
+    own = []
+    others = set()
+    for row in db.session.execute(query):
+        if row.id == vacation_id:
+            continue
+        if row.user_id == user_id:
+            own.append((row.start_date, row.end_date))
+        else:
+            others.add(row.username)
+    return own, sorted(others)
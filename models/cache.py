@@ -0,0 +1,178 @@
+import os
+import threading
+from collections import OrderedDict
+from flask import g, has_app_context
+from models.models import db, User, DataVersion, insert_on_conflict
+
+USERS_VERSION = "users"
+BOARD_VERSION = "board"
+
+_lock = threading.Lock()
+_user_directory = {"version": None, "ids": {}}
+
+
+def get_version(name):
+    """
+    Get the current version of a data group.
+
+    All versions are read with one query and kept for the rest of the
+    request, so checking several caches costs a single round trip.
+
+    :param name: Name of the data group.
+    :return: Version number, 0 if the group was never changed.
+    """
+    versions = g.get("data_versions") if has_app_context() else None
+    if versions is None:
+        versions = dict(db.session.execute(db.select(DataVersion.name, DataVersion.version)).all())
+        if has_app_context():
+            g.data_versions = versions
+    return versions.get(name, 0)
+
+
+def bump_version(*names):
+    """
+    Increment the versions of data groups with a single upsert.
+    The change is executed in the current transaction, so it is committed
+    together with the data it describes.
+
+    :param names: Names of the data groups.
+    :return: None
+    """
+    statement = insert_on_conflict(DataVersion).values([{"name": name, "version": 1} for name in names])
+    db.session.execute(statement.on_conflict_do_update(
+        index_elements=[DataVersion.name],
+        set_={"version": DataVersion.version + 1}
+    ))
+    if has_app_context():
+        g.pop("data_versions", None)
+
+
+def _load_user_directory():
+    """
+    Return the username to ID mapping, reloading it if another process changed the users.
+
+    :return: Dictionary mapping username to user ID.
+    """
+    version = get_version(USERS_VERSION)
+    if version != _user_directory["version"]:
+        ids = dict(db.session.execute(db.select(User.username, User.id).order_by(User.id)).all())
+        with _lock:
+            _user_directory["ids"] = ids
+            _user_directory["version"] = version
+    return _user_directory["ids"]
+
+
+def get_user_ids():
+    """
+    Get the IDs of all users by username.
+
+    :return: Dictionary mapping username to user ID.
+    """
+    return dict(_load_user_directory())
+
+
+def get_usernames():
+    """
+    Get the usernames of all users in the order they were created.
+
+    :return: List of usernames.
+    """
+    return list(_load_user_directory())
+
+
+def get_user_id(username):
+    """
+    Look up the ID of a user by name.
+
+    :param username: Username to look up.
+    :return: User ID, or None if there is no such user.
+    """
+    return _load_user_directory().get(username)
+
+
+def invalidate_user_directory():
+    """
+    Drop the cached user directory of this process.
+    Called after users are added or deleted.
+
+    :return: None
+    """
+    with _lock:
+        _user_directory["version"] = None
+
+
+class RenderCache:
+    """
+    LRU-bounded cache of rendered pages with hit-rate counters.
+
+    Keys must contain the version of the data the page was rendered from,
+    so entries never need to be invalidated: stale ones simply stop being
+    requested and fall out of the LRU.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def get(self, key):
+        """
+        Get a cached page and mark it as recently used.
+
+        :param key: Cache key.
+        :return: Cached page, or None on a miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """
+        Store a page, evicting the least recently used one if the cache is full.
+
+        :param key: Cache key.
+        :param value: Rendered page.
+        :return: None
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def count_not_modified(self):
+        """
+        Count a request answered with 304 Not Modified.
+
+        :return: None
+        """
+        with self._lock:
+            self.not_modified += 1
+
+    def stats(self):
+        """
+        Get the counters of the cache.
+
+        :return: Dictionary with hits, misses, 304 responses, size and hit rate.
+        """
+        with self._lock:
+            served = self.hits + self.not_modified
+            total = served + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "size": len(self._entries),
+                "max_size": self.max_entries,
+                "hit_rate": served / total if total else 0.0
+            }
+
+
+render_cache = RenderCache(int(os.environ.get("RENDER_CACHE_SIZE", 256)))
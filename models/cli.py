@@ -0,0 +1,109 @@
+import click
+from flask import Flask
+from models.models import upgrade_db
+from models.events import prune_changes
+from models.archive import archive_done_tasks
+from models.snapshot import create_snapshot, restore_snapshot
+from models.importer import IMPORT_FORMATS, import_tasks, open_import_stream, read_import_rows
+from models.search import create_search_index, rebuild_search_index
+
+
+def setup_database():
+    """
+    Create the schema of a new database or bring an existing one up to date.
+
+    Runs ``upgrade_db()`` and creates the full-text index of tasks, filling
+    it from the existing tasks if it is new. Safe to run repeatedly.
+
+    Must be called inside an application context.
+
+    Returns:
+        tuple: Names of the created indexes and the number of tasks added
+        to a new search index (None if no index was filled).
+    """
+    created = upgrade_db()
+    indexed = rebuild_search_index() if create_search_index() else None
+    return created, indexed
+
+
+def register_cli(app: Flask):
+    """
+    Register the maintenance commands of the application.
+
+    Commands are run with the Flask CLI, e.g. ``flask --app app upgrade-db``.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
+
+    @app.cli.command("upgrade-db")
+    def upgrade_db_command():
+        """Create the schema of a new database or upgrade an existing one."""
+        created, indexed = setup_database()
+        for name in created:
+            click.echo(f"Created index {name}")
+        if indexed is not None:
+            click.echo(f"Indexed {indexed} tasks for search")
+        if not created and indexed is None:
+            click.echo("Database is up to date")
+
+    @app.cli.command("prune-events")
+    @click.option("--hours", default=24, show_default=True, help="Delete events older than this many hours.")
+    def prune_events_command(hours):
+        """Delete old entries of the live board change log."""
+        deleted = prune_changes(hours)
+        click.echo(f"Deleted {deleted} events")
+
+    @app.cli.command("archive-tasks")
+    @click.option("--days", default=90, show_default=True, help="Archive tasks done more than this many days ago.")
+    @click.option("--batch-size", default=1000, show_default=True, help="Number of tasks moved per transaction.")
+    def archive_tasks_command(days, batch_size):
+        """Move old done tasks from the board to the archive."""
+        archived = archive_done_tasks(days, batch_size)
+        click.echo(f"Archived {archived} tasks")
+
+    @app.cli.command("import-tasks")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--format", "fmt", type=click.Choice(IMPORT_FORMATS), help="File format, by default the file extension.")
+    @click.option("--batch-size", default=1000, show_default=True, help="Number of tasks inserted per transaction.")
+    def import_tasks_command(path, fmt, batch_size):
+        """Create tasks from a CSV or JSON Lines file."""
+        fmt = fmt or path.rsplit(".", 1)[-1].lower()
+        if fmt not in IMPORT_FORMATS:
+            raise click.UsageError(f"Unknown format: {fmt}, use --format")
+
+        with open(path, "rb") as f:
+            try:
+                report = import_tasks(read_import_rows(open_import_stream(f, fmt), fmt), batch_size)
+            except UnicodeDecodeError:
+                raise click.ClickException(f"{path} is not UTF-8 encoded")
+
+        for error in report["errors"]:
+            click.echo(f"Row {error['row']}: {error['error']}", err=True)
+        click.echo(
+            f"Imported {report['imported']} tasks, {report['failed']} rows failed, "
+            f"{report['seconds']} s ({report['rows_per_second']} rows/s)"
+        )
+
+    @app.cli.command("snapshot")
+    @click.argument("path", type=click.Path(dir_okay=False))
+    def snapshot_command(path):
+        """Write users, tasks, vacations and status history to a compressed snapshot file."""
+        counts = create_snapshot(path)
+        click.echo(f"Wrote {path}: " + ", ".join(f"{count} {name} rows" for name, count in counts.items()))
+
+    @app.cli.command("restore")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--replace", is_flag=True, help="Delete the existing users, tasks, vacations, archived tasks and change events first.")
+    @click.option("--batch-size", default=5000, show_default=True, help="Number of rows per INSERT.")
+    def restore_command(path, replace, batch_size):
+        """Load a snapshot file written by the snapshot command."""
+        try:
+            counts = restore_snapshot(path, replace, batch_size)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        seconds = counts.pop("seconds")
+        click.echo(f"Restored {path} in {seconds} s: " + ", ".join(f"{count} {name} rows" for name, count in counts.items()))
@@ -0,0 +1,80 @@
+import json
+from datetime import datetime, timedelta
+from models.models import db, ChangeEvent
+
+
+def record_change(entity, entity_id, action, payload=None):
+    """
+    Append a change to the change log.
+
+    The event is only added to the session, so it is committed (or rolled
+    back) together with the change it describes.
+
+    :param entity: Kind of the changed object (task, vacation, user).
+    :param entity_id: ID of the changed object.
+    :param action: Kind of change (create, update, delete).
+    :param payload: Optional JSON-serializable data to store with the event.
+    :return: None
+    """
+    db.session.add(ChangeEvent(
+        entity=entity,
+        entity_id=entity_id,
+        action=action,
+        payload=json.dumps(payload) if payload is not None else None
+    ))
+
+
+def get_latest_change_id():
+    """
+    Get the ID of the most recent change.
+
+    :return: Highest event ID, or 0 if the log is empty.
+    """
+    return db.session.query(db.func.max(ChangeEvent.id)).scalar() or 0
+
+
+def get_changes_since(last_id, limit=100, window=0, exclude=()):
+    """
+    Retrieve the changes recorded after a given event.
+
+    Event IDs are taken when a change is written but become visible when it
+    is committed, so a change with a lower ID can appear after a higher one.
+    Readers re-read the last ``window`` IDs and pass the events they already
+    delivered in ``exclude``.
+
+    :param last_id: ID of the last event the reader has seen.
+    :param limit: Maximum number of events to return.
+    :param window: Number of IDs before last_id to read again.
+    :param exclude: IDs of events already delivered.
+    :return: List of ChangeEvent objects ordered by ID.
+    """
+    query = ChangeEvent.query.filter(ChangeEvent.id > last_id - window)
+    if exclude:
+        query = query.filter(ChangeEvent.id.not_in(list(exclude)))
+    return query.order_by(ChangeEvent.id).limit(limit).all()
+
+
+def get_change_ids(first_id, last_id):
+    """
+    Get the IDs of the committed changes in a range.
+
+    :param first_id: Lowest ID, exclusive.
+    :param last_id: Highest ID, inclusive.
+    :return: Set of event IDs.
+    """
+    return set(db.session.scalars(
+        db.select(ChangeEvent.id).where(ChangeEvent.id > first_id, ChangeEvent.id <= last_id)
+    ))
+
+
+def prune_changes(max_age_hours=24):
+    """
+    Delete changes older than the given age.
+
+    :param max_age_hours: Age in hours after which events are deleted.
+    :return: Number of deleted events.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+    deleted = ChangeEvent.query.filter(ChangeEvent.created_at < cutoff).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
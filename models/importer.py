@@ -0,0 +1,219 @@
+import csv
+import io
+import json
+import time
+from datetime import date, datetime
+from models.models import db, User, Task, Tag, TaskTransition, task_tag, insert_on_conflict
+from models.search import index_tasks
+from models.services import upsert_tags
+from models.cache import BOARD_VERSION, USERS_VERSION, bump_version, get_user_ids, invalidate_user_directory
+from models.utils import parse_custom_date, parse_task_fields
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+# Length of the username column
+MAX_USERNAME_LENGTH = 50
+
+# Errors listed in the report, the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+def read_import_rows(stream, fmt):
+    """
+    Read the rows of an import file.
+
+    CSV files need a header line. Columns are the ones of an export:
+    username, title, status, type, priority, start_date, deadline, tags,
+    task_type, status_date and comment (an id column is ignored).
+
+    :param stream: Text stream of the file.
+    :param fmt: File format, csv or jsonl.
+    :return: Generator of (line number, dictionary of raw values) tuples.
+             Lines that are not valid JSON are returned as the error message.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, f"Invalid JSON: {e}"
+            continue
+        yield line_number, row if isinstance(row, dict) else "Expected a JSON object"
+
+
+def parse_import_row(data):
+    """
+    Convert the raw values of an imported row into task columns.
+
+    Fields are validated like the board validates edits; missing fields get
+    the defaults of the add task form. Numbers in JSON rows are read as
+    text, other values must be strings (tags may also be a list of strings).
+
+    :param data: Dictionary of raw values.
+    :return: Tuple of (username, dictionary of task columns, list of tag names).
+    :raises ValueError: If a field is missing or invalid.
+    """
+    data = {
+        key: str(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+        for key, value in data.items() if value not in (None, "")
+    }
+    username = data.get("username") or data.get("user") or ""
+    if not isinstance(username, str):
+        raise ValueError("username must be a string")
+    username = username.strip()
+    if not username:
+        raise ValueError("Username is required")
+    if len(username) > MAX_USERNAME_LENGTH:
+        raise ValueError(f"username is longer than {MAX_USERNAME_LENGTH} characters")
+    if not data.get("title"):
+        raise ValueError("Title is required")
+    if not isinstance(data.get("status_date", ""), str):
+        raise ValueError("status_date must be a string")
+
+    fields = parse_task_fields(data)
+    today = date.today()
+    task = {
+        "title": fields["title"],
+        "status": fields.get("status", "todo"),
+        "type": fields.get("type", "task"),
+        "priority": fields.get("priority", "medium"),
+        "start_date": fields.get("start_date") or today,
+        "deadline": fields.get("deadline"),
+        "tags": ",".join(fields.get("tags", [])),
+        "task_type": fields.get("task_type", "REG"),
+        "status_date": parse_custom_date(data.get("status_date")) or today,
+        "comment": fields.get("comment", "")
+    }
+    return username, task, fields.get("tags", [])
+
+
+def _resolve_users(usernames):
+    """
+    Get the IDs of the given users, inserting the missing ones with one statement.
+
+    :param usernames: Set of usernames.
+    :return: Tuple of (dictionary mapping username to user ID, True if users were created).
+    """
+    user_ids = get_user_ids()
+    missing = [name for name in usernames if name not in user_ids]
+    if not missing:
+        return user_ids, False
+
+    db.session.execute(
+        insert_on_conflict(User).values([{"username": name} for name in missing])
+        .on_conflict_do_nothing(index_elements=[User.username])
+    )
+    user_ids.update(db.session.execute(
+        db.select(User.username, User.id).where(User.username.in_(missing))
+    ).all())
+    return user_ids, True
+
+
+def _insert_batch(batch, user_ids):
+    """
+    Insert a batch of parsed rows with their tags, status history and search entries.
+    Not committed.
+
+    :param batch: List of (username, task columns, tag names) tuples.
+    :param user_ids: Dictionary mapping username to user ID.
+    :return: None
+    """
+    rows = [dict(task, user_id=user_ids[username]) for username, task, _ in batch]
+    task_ids = db.session.scalars(
+        db.insert(Task).returning(Task.id, sort_by_parameter_order=True), rows
+    ).all()
+
+    names = {name for _, _, tags in batch for name in tags}
+    if names:
+        upsert_tags(list(names))
+        tag_ids = dict(db.session.execute(db.select(Tag.name, Tag.id).where(Tag.name.in_(names))).all())
+        links = [
+            {"task_id": task_id, "tag_id": tag_ids[name]}
+            for task_id, (_, _, tags) in zip(task_ids, batch)
+            for name in dict.fromkeys(tags)
+        ]
+        db.session.execute(task_tag.insert(), links)
+
+    now = datetime.utcnow()
+    db.session.execute(db.insert(TaskTransition), [
+        {
+            "task_id": task_id, "user_id": row["user_id"], "task_type": row["task_type"],
+            "from_status": None, "to_status": row["status"], "changed_at": now
+        }
+        for task_id, row in zip(task_ids, rows)
+    ])
+    index_tasks(task_ids, new=True)
+
+
+def import_tasks(records, batch_size=1000):
+    """
+    Create tasks from imported rows in batches.
+
+    All rows are validated first and the owners are resolved in one pass
+    (missing users are created). Valid rows are then inserted ``batch_size``
+    at a time with executemany statements and one commit per batch, instead
+    of a lookup, an insert and a commit per task. Boards are refreshed
+    through the data version; no live events are sent for imported tasks.
+
+    Must be called inside an application context.
+
+    :param records: Iterable of (line number, raw row) tuples as returned by read_import_rows().
+    :param batch_size: Number of tasks inserted per transaction.
+    :return: Dictionary with the number of imported rows, the number of
+             rows with errors, the first errors, the duration and the rows per second.
+    :raises UnicodeDecodeError: If the file is not UTF-8. Nothing is written then,
+                                since rows are only inserted after all of them are read.
+    """
+    start = time.perf_counter()
+    parsed, errors, error_count = [], [], 0
+    for line_number, data in records:
+        try:
+            if isinstance(data, str):
+                raise ValueError(data)
+            parsed.append(parse_import_row(data))
+        except ValueError as e:
+            error_count += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": line_number, "error": str(e)})
+
+    imported = 0
+    if parsed:
+        user_ids, users_created = _resolve_users({username for username, _, _ in parsed})
+        if users_created:
+            bump_version(USERS_VERSION, BOARD_VERSION)
+            db.session.commit()
+            invalidate_user_directory()
+
+        for i in range(0, len(parsed), batch_size):
+            batch = parsed[i:i + batch_size]
+            _insert_batch(batch, user_ids)
+            bump_version(BOARD_VERSION)
+            db.session.commit()
+            imported += len(batch)
+
+    seconds = time.perf_counter() - start
+    return {
+        "imported": imported,
+        "failed": error_count,
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(imported / seconds, 1) if seconds else None
+    }
+
+
+def open_import_stream(binary, fmt):
+    """
+    Wrap an uploaded or opened binary file for read_import_rows().
+
+    :param binary: Binary file object.
+    :param fmt: File format, csv or jsonl.
+    :return: Text stream (UTF-8, a byte order mark is skipped).
+    """
+    return io.TextIOWrapper(binary, encoding="utf-8-sig", newline="" if fmt == "csv" else None)
@@ -0,0 +1,235 @@
+import os
+import threading
+import time
+from flask import Flask, g, has_app_context, request, template_rendered, before_render_template
+from sqlalchemy import event
+from models.models import db
+
+# Upper bounds of the request latency histogram, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Number of statements logged with a slow request
+SLOWEST_STATEMENTS = 3
+
+
+class Metrics:
+    """
+    Per-endpoint request metrics of this process, rendered in the Prometheus text format.
+
+    Every worker process keeps its own numbers, Prometheus adds them up
+    when it scrapes each worker.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._latency = {}
+        self._endpoints = {}
+
+    def observe(self, endpoint, method, status, latency, sql_queries, db_time, template_time):
+        """
+        Record a finished request.
+
+        Args:
+            endpoint: Flask endpoint name
+            method: HTTP method
+            status: HTTP status code
+            latency: Request duration in seconds
+            sql_queries: Number of SQL statements of the request
+            db_time: Time spent executing SQL statements, in seconds
+            template_time: Time spent rendering templates, in seconds
+
+        Returns:
+            None
+        """
+        with self._lock:
+            key = (endpoint, method, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+            histogram = self._latency.setdefault((endpoint, method), [[0] * len(self.buckets), 0, 0.0])
+            for i, bound in enumerate(self.buckets):
+                if latency <= bound:
+                    histogram[0][i] += 1
+            histogram[1] += 1
+            histogram[2] += latency
+
+            totals = self._endpoints.setdefault(endpoint, [0, 0.0, 0.0])
+            totals[0] += sql_queries
+            totals[1] += db_time
+            totals[2] += template_time
+
+    def render(self):
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            Text with one sample per line
+        """
+        with self._lock:
+            requests = dict(self._requests)
+            latency = {key: (list(counts), count, total) for key, (counts, count, total) in self._latency.items()}
+            endpoints = {key: list(totals) for key, totals in self._endpoints.items()}
+
+        lines = [
+            "# HELP kanban_requests_total Requests by endpoint, method and status.",
+            "# TYPE kanban_requests_total counter"
+        ]
+        for (endpoint, method, status), count in sorted(requests.items()):
+            lines.append(f'kanban_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}')
+
+        lines += [
+            "# HELP kanban_request_duration_seconds Request duration by endpoint and method.",
+            "# TYPE kanban_request_duration_seconds histogram"
+        ]
+        for (endpoint, method), (counts, count, total) in sorted(latency.items()):
+            labels = f'endpoint="{endpoint}",method="{method}"'
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'kanban_request_duration_seconds_bucket{{{labels},le="{bound}"}} {bucket_count}')
+            lines.append(f'kanban_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"kanban_request_duration_seconds_sum{{{labels}}} {total:.6f}")
+            lines.append(f"kanban_request_duration_seconds_count{{{labels}}} {count}")
+
+        for index, name, help_text in (
+            (0, "kanban_sql_statements_total", "SQL statements executed by endpoint."),
+            (1, "kanban_db_seconds_total", "Time spent executing SQL statements by endpoint."),
+            (2, "kanban_template_seconds_total", "Time spent rendering templates by endpoint.")
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for endpoint, totals in sorted(endpoints.items()):
+                value = totals[index] if index == 0 else f"{totals[index]:.6f}"
+                lines.append(f'{name}{{endpoint="{endpoint}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    Count the SQL statement in the current request and remember when it started.
+
+    Registered as a ``before_cursor_execute`` listener on the engines.
+    Statements executed outside of an application context (CLI scripts,
+    background jobs) are not counted.
+    """
+    if has_app_context():
+        g.sql_queries = g.get("sql_queries", 0) + 1
+        context._query_start = time.perf_counter()
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    Add the duration of the SQL statement to the database time of the current request.
+
+    Registered as an ``after_cursor_execute`` listener on the engines. If
+    slow requests are logged, the slowest statements are kept as well.
+    """
+    start = getattr(context, "_query_start", None)
+    if start is None or not has_app_context():
+        return
+
+    duration = time.perf_counter() - start
+    g.db_time = g.get("db_time", 0.0) + duration
+    if "slowest_statements" in g:
+        slowest = g.slowest_statements
+        slowest.append((duration, statement))
+        slowest.sort(key=lambda item: item[0], reverse=True)
+        del slowest[SLOWEST_STATEMENTS:]
+
+
+def _before_render(sender, template, context, **extra):
+    """
+    Remember when a template started rendering.
+    """
+    g.template_start = time.perf_counter()
+
+
+def _after_render(sender, template, context, **extra):
+    """
+    Add the duration of a rendered template to the render time of the current request.
+    """
+    start = g.pop("template_start", None)
+    if start is not None:
+        g.template_time = g.get("template_time", 0.0) + time.perf_counter() - start
+
+
+def get_query_count():
+    """
+    Get the number of SQL statements executed during the current request.
+
+    Returns:
+        Number of statements sent to the database so far
+    """
+    return g.get("sql_queries", 0)
+
+
+def init_instrumentation(app: Flask):
+    """
+    Instrument requests, SQL statements and template rendering.
+
+    Every request is timed and recorded in ``metrics`` per endpoint together
+    with its number of SQL statements, the time spent in the database
+    (engine events on the primary and the read replica) and the time spent
+    rendering templates. The statement count is also reported in the
+    ``X-SQL-Queries`` response header and the timings in ``Server-Timing``.
+
+    If SLOW_REQUEST_MS is set, slower requests are logged as warnings with
+    their slowest statements.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
+    slow_request_ms = os.environ.get("SLOW_REQUEST_MS")
+    slow_request = float(slow_request_ms) / 1000 if slow_request_ms else None
+
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        if not event.contains(engine, "before_cursor_execute", _before_execute):
+            event.listen(engine, "before_cursor_execute", _before_execute)
+            event.listen(engine, "after_cursor_execute", _after_execute)
+
+    before_render_template.connect(_before_render, app)
+    template_rendered.connect(_after_render, app)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_start = time.perf_counter()
+        if slow_request is not None:
+            g.slowest_statements = []
+
+    @app.after_request
+    def record_request(response):
+        start = g.get("request_start")
+        if start is None:
+            return response
+
+        latency = time.perf_counter() - start
+        sql_queries = get_query_count()
+        db_time = g.get("db_time", 0.0)
+        template_time = g.get("template_time", 0.0)
+        endpoint = request.endpoint or "unknown"
+        metrics.observe(endpoint, request.method, response.status_code, latency, sql_queries, db_time, template_time)
+
+        response.headers["X-SQL-Queries"] = str(sql_queries)
+        response.headers["Server-Timing"] = (
+            f"db;dur={db_time * 1000:.1f}, tpl;dur={template_time * 1000:.1f}, total;dur={latency * 1000:.1f}"
+        )
+
+        if slow_request is not None and latency >= slow_request:
+            statements = "".join(
+                f"\n  {duration * 1000:.1f} ms: {' '.join(statement.split())[:300]}"
+                for duration, statement in g.get("slowest_statements", [])
+            )
+            app.logger.warning(
+                "Slow request %s %s (%s): %.1f ms, %d SQL statements, %.1f ms in the database, "
+                "%.1f ms rendering templates%s",
+                request.method, request.full_path, endpoint, latency * 1000, sql_queries,
+                db_time * 1000, template_time * 1000, statements
+            )
+        return response
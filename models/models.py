@@ -1,12 +1,51 @@
 import os
-from datetime import date
+import time
+from datetime import date, datetime
 from flask_sqlalchemy import SQLAlchemy
-from flask import Flask
-from dotenv import load_dotenv
+from flask_sqlalchemy.session import Session
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+from flask import Flask, current_app, has_request_context, request, session
 
-load_dotenv()
+# Bind key of the optional read replica (DATABASE_READ_URL)
+READ_BIND = "replica"
 
-db = SQLAlchemy()
+
+class RoutingSession(Session):
+    """
+    Session that sends the reads of GET requests to the read replica.
+
+    Everything else goes to the primary database:
+
+    - statements outside of a request (CLI commands, scripts),
+    - requests with any other method (POST, PATCH, ...),
+    - flushes and INSERT/UPDATE/DELETE statements, and every statement of
+      the request after the first write,
+    - GET requests of a client that changed data within the last
+      ``READ_AFTER_WRITE_SECONDS`` seconds, e.g. the board shown by the
+      redirect after a form submit (read-your-writes).
+
+    Without DATABASE_READ_URL it behaves like the default session.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._use_replica(clause):
+            return self._db.engines[READ_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_replica(self, clause):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info["wrote"] = True
+        if self.info.get("wrote") or not has_request_context():
+            return False
+        if request.method not in ("GET", "HEAD") or READ_BIND not in self._db.engines:
+            return False
+
+        written_at = session.get("db_written_at", 0)
+        return time.time() - written_at > current_app.config["READ_AFTER_WRITE_SECONDS"]
+
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 
 class User(db.Model):
@@ -24,6 +63,27 @@ class User(db.Model):
     vacations = db.relationship("Vacation", back_populates="user", cascade="all, delete-orphan")
 
 
+task_tag = db.Table(
+    "task_tag",
+    db.Column("task_id", db.Integer, db.ForeignKey("task.id"), primary_key=True),
+    db.Column("tag_id", db.Integer, db.ForeignKey("tag.id"), primary_key=True),
+    # Tasks with a given tag; the primary key covers the opposite direction
+    db.Index("ix_task_tag_tag_task", "tag_id", "task_id"),
+)
+
+
+class Tag(db.Model):
+    """
+    Represents a tag that can be attached to tasks.
+
+    Attributes:
+        id (int): Primary key.
+        name (str): Unique name of the tag.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String, unique=True, nullable=False)
+
+
 class Task(db.Model):
     """
     Represents a task in the system.
@@ -36,7 +96,8 @@ class Task(db.Model):
         priority (str): Priority of the task (default: "средний").
         start_date (date): Date when the task starts (default: today).
         deadline (date): Optional deadline date for the task.
-        tags (str): Comma-separated tags for the task.
+        tags (str): Comma-separated tags for the task, kept for display.
+        tag_items (list[Tag]): Normalized tags, used for filtering.
         task_type (str): Task category (default: "REG").
         status_date (date): Date when the status was last updated (default: today).
         user_id (int): Foreign key referencing the user.
@@ -51,9 +112,22 @@ class Task(db.Model):
     deadline = db.Column(db.Date, nullable=True)
     tags = db.Column(db.String, default="")
     task_type = db.Column(db.String(20), default="REG")
-    status_date = db.Column(db.Date, default=date.today)
+    status_date = db.Column(db.Date, nullable=False, default=date.today)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     comment = db.Column(db.Text, default="")
+    tag_items = db.relationship("Tag", secondary=task_tag, lazy=True)
+
+    __table_args__ = (
+        # Users view and category view filtered by user
+        db.Index("ix_task_user_type_status", "user_id", "task_type", "status"),
+        # Category view for all users
+        db.Index("ix_task_type_status", "task_type", "status"),
+        # Keyset pagination of a status column
+        db.Index("ix_task_status_date", "status", "status_date", "id"),
+        # IDs of deleted or archived tasks are never handed out again, the
+        # status history and the archive still refer to them
+        {"sqlite_autoincrement": True},
+    )
 
 
 class Vacation(db.Model):
@@ -78,13 +152,146 @@ class Vacation(db.Model):
 
     user = db.relationship("User", back_populates="vacations")
 
+    __table_args__ = (
+        # Vacations of one user and the Gantt chart ordering
+        db.Index("ix_vacation_user_start", "user_id", "start_date"),
+        # Vacations overlapping a date range
+        db.Index("ix_vacation_start_end", "start_date", "end_date"),
+        # Vacations still running on or after a date (who is out today / this quarter)
+        db.Index("ix_vacation_end_start", "end_date", "start_date"),
+    )
+
+
+class TaskArchive(db.Model):
+    """
+    Represents a task that was moved out of the board after being done for a while.
+
+    Rows are copied from the task table by the archiver and keep the task ID.
+    The owner's username is copied as well, so archived tasks stay readable
+    after the user is deleted.
+
+    Attributes:
+        id (int): Primary key, ID of the original task.
+        title (str): Title of the task.
+        status (str): Status of the task when it was archived.
+        type (str): Type of task.
+        priority (str): Priority of the task.
+        start_date (date): Date when the task started.
+        deadline (date): Optional deadline date for the task.
+        tags (str): Comma-separated tags of the task.
+        task_type (str): Task category.
+        status_date (date): Date of the last status change (when the task was done).
+        user_id (int): ID of the task owner.
+        username (str): Username of the task owner.
+        comment (str): Optional comment for the task.
+        archived_at (datetime): When the task was archived.
+    """
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    title = db.Column(db.String(200), nullable=False)
+    status = db.Column(db.String(20))
+    type = db.Column(db.String(20))
+    priority = db.Column(db.String(20))
+    start_date = db.Column(db.Date)
+    deadline = db.Column(db.Date, nullable=True)
+    tags = db.Column(db.String, default="")
+    task_type = db.Column(db.String(20))
+    status_date = db.Column(db.Date)
+    user_id = db.Column(db.Integer, nullable=False)
+    username = db.Column(db.String(50))
+    comment = db.Column(db.Text, default="")
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Browsing the archive, newest first
+        db.Index("ix_task_archive_status_date", "status_date", "id"),
+        # Browsing the archive of one user
+        db.Index("ix_task_archive_user_status_date", "user_id", "status_date", "id"),
+    )
+
+
+class TaskTransition(db.Model):
+    """
+    Represents a status change of a task. Rows are only ever appended.
+
+    The owner and category are copied from the task at the time of the
+    change, so the history stays usable after tasks are edited or deleted.
+
+    Attributes:
+        id (int): Primary key.
+        task_id (int): ID of the task.
+        user_id (int): ID of the task owner.
+        task_type (str): Task category.
+        from_status (str): Previous status, None when the task was created.
+        to_status (str): New status.
+        changed_at (datetime): When the status changed.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    task_id = db.Column(db.Integer, nullable=False)
+    user_id = db.Column(db.Integer, nullable=False)
+    task_type = db.Column(db.String(20))
+    from_status = db.Column(db.String(20), nullable=True)
+    to_status = db.Column(db.String(20), nullable=False)
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # History of one task
+        db.Index("ix_task_transition_task_changed", "task_id", "changed_at"),
+        # Tasks that reached a status in a period (throughput, cycle time)
+        db.Index("ix_task_transition_status_changed", "to_status", "changed_at"),
+    )
+
+
+class ChangeEvent(db.Model):
+    """
+    Represents a change to a task, vacation or user, read by the live board feed.
+
+    Every worker appends events in the same transaction as the change itself,
+    so the table is the shared change log of all processes.
+
+    Attributes:
+        id (int): Primary key, increasing with every change.
+        entity (str): Kind of the changed object (task, vacation, user).
+        entity_id (int): ID of the changed object.
+        action (str): Kind of change (create, update, delete).
+        payload (str): Optional JSON with data that cannot be looked up later.
+        created_at (datetime): When the change was recorded.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(20), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    action = db.Column(db.String(10), nullable=False)
+    payload = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    # Readers resume after the last ID they saw, so IDs must not start again
+    # when the table was emptied by pruning or a restore
+    __table_args__ = {"sqlite_autoincrement": True}
+
+
+class DataVersion(db.Model):
+    """
+    Represents a version counter of a group of data (e.g. users).
+
+    Write functions increment the counter in the same transaction as the
+    change, so process-level caches in every worker can tell whether they
+    are stale with a single primary key lookup.
+
+    Attributes:
+        name (str): Name of the data group, primary key.
+        version (int): Counter increased on every change.
+    """
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
 
 def init_db(app: Flask):
     """
     Initialize the database with the given Flask app.
 
     Sets up the SQLAlchemy database URI from environment variables or defaults to a local SQLite database.
-    Creates all tables defined in the models.
+    If DATABASE_READ_URL is set, reads of GET requests go to that database (see RoutingSession),
+    and clients that change data are pinned to the primary for READ_AFTER_WRITE_SECONDS (default 5).
+    Does not touch the database: tables are created by ``upgrade_db()``.
 
     Args:
         app (Flask): The Flask application instance.
@@ -95,7 +302,267 @@ def init_db(app: Flask):
     DB_URL = os.environ.get("DATABASE_URL") or "sqlite:///local.db"
     app.config['SQLALCHEMY_DATABASE_URI'] = DB_URL
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    READ_URL = os.environ.get("DATABASE_READ_URL")
+    if READ_URL:
+        app.config['SQLALCHEMY_BINDS'] = {READ_BIND: READ_URL}
+    app.config['READ_AFTER_WRITE_SECONDS'] = float(os.environ.get("READ_AFTER_WRITE_SECONDS", 5))
     db.init_app(app)
 
+    @app.after_request
+    def remember_write(response):
+        if db.session.info.get("wrote"):
+            session["db_written_at"] = time.time()
+        return response
+
+
+def insert_on_conflict(table):
+    """
+    Build an INSERT supporting ``on_conflict_do_nothing`` / ``on_conflict_do_update``
+    for the database dialect of the session (SQLite or PostgreSQL).
+
+    Used for upserts that need a single statement instead of a SELECT
+    followed by an INSERT.
+
+    Args:
+        table: Model class or table to insert into.
+
+    Returns:
+        Insert statement of the matching dialect.
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def dispose_engines(app: Flask):
+    """
+    Drop the pooled connections inherited from the parent process.
+
+    Called in every worker right after the fork, so workers open their own
+    connections instead of sharing the parent's sockets. The parent's
+    connections are left open for the parent.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        None
+    """
     with app.app_context():
-        db.create_all()
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def upgrade_db():
+    """
+    Bring an existing database up to date with the models.
+
+    ``db.create_all()`` only creates missing tables, so indexes added to
+    tables that already exist are created here, comma-separated task tags
+    are copied into the tag tables, tasks without a status date get one and
+    tasks without status history get their current status as the first
+    transition. Every step checks first and is safe to run repeatedly.
+
+    Must be called inside an application context.
+
+    Returns:
+        list[str]: Names of the indexes that were created.
+    """
+    db.create_all()
+    migrate_status_dates()
+    migrate_task_ids()
+    migrate_change_ids()
+
+    created = []
+    inspector = db.inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind=db.engine)
+                created.append(index.name)
+
+    migrate_tags()
+    migrate_transitions()
+    return created
+
+
+def migrate_status_dates():
+    """
+    Give tasks without a status date the current date.
+
+    Boards showed such tasks as changed today, but the keyset pagination of
+    the columns cannot page past NULL dates. On PostgreSQL the column is
+    made NOT NULL as well; on SQLite the model default keeps new rows filled.
+
+    Returns:
+        int: Number of updated tasks.
+    """
+    result = db.session.execute(
+        db.update(Task).where(Task.status_date.is_(None)).values(status_date=date.today())
+    )
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(db.text("ALTER TABLE task ALTER COLUMN status_date SET NOT NULL"))
+    db.session.commit()
+    return result.rowcount
+
+
+def _rebuild_with_autoincrement(table):
+    """
+    Rebuild a SQLite table created without AUTOINCREMENT, keeping its rows.
+
+    The indexes of the table are created again by ``upgrade_db()``. Not
+    committed.
+
+    Args:
+        table: Table of a model declared with ``sqlite_autoincrement``.
+
+    Returns:
+        bool: True if the table was rebuilt, False if it already uses
+        AUTOINCREMENT or the database is not SQLite.
+    """
+    if db.engine.dialect.name != "sqlite":
+        return False
+    schema = db.session.scalar(
+        db.text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": table.name}
+    )
+    if "AUTOINCREMENT" in schema.upper():
+        return False
+
+    # A copy of the table under another name, with the tables its foreign keys refer to
+    metadata = db.MetaData()
+    for key in table.foreign_keys:
+        key.column.table.to_metadata(metadata)
+    rebuilt = table.to_metadata(metadata, name=f"{table.name}_rebuild")
+    columns = ", ".join(column.name for column in table.columns)
+
+    db.session.execute(db.text(f"DROP TABLE IF EXISTS {rebuilt.name}"))
+    db.session.execute(CreateTable(rebuilt))
+    db.session.execute(db.text(f"INSERT INTO {rebuilt.name} ({columns}) SELECT {columns} FROM {table.name}"))
+    db.session.execute(db.text(f"DROP TABLE {table.name}"))
+    db.session.execute(db.text(f"ALTER TABLE {rebuilt.name} RENAME TO {table.name}"))
+    return True
+
+
+def migrate_task_ids():
+    """
+    Stop SQLite from reusing the IDs of deleted tasks.
+
+    Without AUTOINCREMENT SQLite hands out the highest ID again after the
+    newest task was deleted or archived, so the new task would inherit the
+    status history of the old one and collide with it in the archive. The
+    task table of older databases is rebuilt with AUTOINCREMENT (its indexes
+    are created again by ``upgrade_db()``), and the ID sequence continues
+    after every ID known to the history and the archive. Nothing to do on
+    PostgreSQL, where sequences never go back.
+
+    Returns:
+        bool: True if the table was rebuilt.
+    """
+    if not _rebuild_with_autoincrement(Task.__table__):
+        return False
+
+    last_id = max(
+        db.session.scalar(db.select(db.func.max(column))) or 0
+        for column in (Task.id, TaskTransition.task_id, TaskArchive.id)
+    )
+    db.session.execute(db.text("DELETE FROM sqlite_sequence WHERE name = 'task'"))
+    db.session.execute(db.text("INSERT INTO sqlite_sequence (name, seq) VALUES ('task', :seq)"), {"seq": last_id})
+    db.session.commit()
+    return True
+
+
+def migrate_change_ids():
+    """
+    Stop SQLite from starting the change log IDs again once it is empty.
+
+    Boards resume the live feed after the last event ID they saw, so IDs
+    handed out again after ``prune-events`` or ``restore --replace`` emptied
+    the table would be missed. The change_event table of older databases is
+    rebuilt with AUTOINCREMENT. Nothing to do on PostgreSQL.
+
+    Returns:
+        bool: True if the table was rebuilt.
+    """
+    if not _rebuild_with_autoincrement(ChangeEvent.__table__):
+        return False
+    db.session.commit()
+    return True
+
+
+def migrate_tags():
+    """
+    Copy the comma-separated ``Task.tags`` strings into the tag tables.
+
+    Only tasks that have tags but no rows in ``task_tag`` yet are migrated.
+
+    Returns:
+        int: Number of migrated tasks.
+    """
+    tagged_ids = db.select(task_tag.c.task_id)
+    rows = db.session.execute(
+        db.select(Task.id, Task.tags)
+        .where(Task.tags != "", Task.tags.is_not(None), Task.id.not_in(tagged_ids))
+    ).all()
+    if not rows:
+        return 0
+
+    task_tags = {
+        task_id: {tag.strip() for tag in tags.split(",") if tag.strip()}
+        for task_id, tags in rows
+    }
+    names = set().union(*task_tags.values())
+
+    tag_ids = dict(db.session.execute(db.select(Tag.name, Tag.id).where(Tag.name.in_(names))).all())
+    missing = [{"name": name} for name in names if name not in tag_ids]
+    if missing:
+        db.session.execute(db.insert(Tag), missing)
+        tag_ids = dict(db.session.execute(db.select(Tag.name, Tag.id).where(Tag.name.in_(names))).all())
+
+    links = [
+        {"task_id": task_id, "tag_id": tag_ids[name]}
+        for task_id, tags in task_tags.items()
+        for name in tags
+    ]
+    if links:
+        db.session.execute(task_tag.insert(), links)
+    db.session.commit()
+    return len(task_tags)
+
+
+def migrate_transitions(batch_size=10000):
+    """
+    Record the current status of tasks that have no status history yet.
+
+    The start of the status date is used as the time of the transition. It
+    is passed as a datetime from Python: copied in SQL, SQLite would store
+    the bare date, which sorts before every time of that day and drops the
+    transition from flow metrics starting on that day. Such values written
+    by earlier versions are repaired.
+
+    Args:
+        batch_size: Number of transitions inserted per statement.
+
+    Returns:
+        int: Number of migrated tasks.
+    """
+    if db.engine.dialect.name == "sqlite":
+        db.session.execute(db.text(
+            "UPDATE task_transition SET changed_at = changed_at || ' 00:00:00.000000' WHERE length(changed_at) = 10"
+        ))
+
+    known_ids = db.select(TaskTransition.task_id)
+    rows = db.session.execute(
+        db.select(Task.id, Task.user_id, Task.task_type, Task.status, Task.status_date)
+        .where(Task.id.not_in(known_ids))
+    ).all()
+    for i in range(0, len(rows), batch_size):
+        db.session.execute(db.insert(TaskTransition), [
+            {
+                "task_id": task_id, "user_id": user_id, "task_type": task_type, "to_status": status,
+                "changed_at": datetime.combine(status_date, datetime.min.time())
+            }
+            for task_id, user_id, task_type, status, status_date in rows[i:i + batch_size]
+        ])
+    db.session.commit()
+    return len(rows)
@@ -0,0 +1,162 @@
+import re
+from models.models import db
+
+# Search terms are reduced to words, so user input never reaches the query syntax
+MAX_SEARCH_TERMS = 10
+
+SQLITE_INDEX = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS task_fts "
+    "USING fts5(title, comment, tags, tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+# The same expression is used in queries, so PostgreSQL answers them from the index
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(task.title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(task.tags, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(task.comment, '')), 'D')"
+)
+POSTGRES_INDEX = f"CREATE INDEX IF NOT EXISTS ix_task_search ON task USING gin (({POSTGRES_DOCUMENT}))"
+
+# Lightweight handle on the FTS5 table for statements built with the expression language
+TASK_FTS = db.table("task_fts", db.column("rowid"))
+
+
+def _dialect():
+    """
+    Get the name of the database dialect of the current session.
+    """
+    return db.session.get_bind().dialect.name
+
+
+def create_search_index():
+    """
+    Create the full-text index of tasks if it does not exist.
+
+    SQLite gets an FTS5 table with one row per task, filled by
+    ``index_tasks``. PostgreSQL gets a GIN index over a tsvector expression
+    of the task table, which the database keeps up to date by itself.
+
+    Must be called inside an application context.
+
+    :return: True if the index was created, False if it already existed.
+    """
+    dialect = _dialect()
+    if dialect == "sqlite":
+        created = not db.inspect(db.engine).has_table("task_fts")
+        db.session.execute(db.text(SQLITE_INDEX))
+    elif dialect == "postgresql":
+        created = "ix_task_search" not in {index["name"] for index in db.inspect(db.engine).get_indexes("task")}
+        db.session.execute(db.text(POSTGRES_INDEX))
+    else:
+        created = False
+    db.session.commit()
+    return created
+
+
+def index_tasks(task_ids, new=False):
+    """
+    Bring the full-text entries of the given tasks in line with the task table.
+
+    Pending changes of the session are flushed first. Called by the service
+    write functions before they commit, so the index changes in the same
+    transaction as the tasks. Nothing to do on PostgreSQL.
+
+    :param task_ids: IDs of the created or edited tasks.
+    :param new: True for tasks that were just created and have no entries yet.
+    :return: None
+    """
+    task_ids = list(task_ids)
+    if not task_ids or _dialect() != "sqlite":
+        return
+
+    db.session.flush()
+    if not new:
+        unindex_tasks(task_ids)
+    db.session.execute(
+        db.text(
+            "INSERT INTO task_fts (rowid, title, comment, tags) "
+            "SELECT id, title, comment, tags FROM task WHERE id IN :ids"
+        ).bindparams(db.bindparam("ids", expanding=True)),
+        {"ids": task_ids}
+    )
+
+
+def unindex_tasks(task_ids):
+    """
+    Remove the full-text entries of the given tasks, e.g. after they were deleted.
+    Nothing to do on PostgreSQL.
+
+    :param task_ids: IDs of the tasks, or a select of task IDs to remove a
+                     set of any size in one statement (run it before the tasks are deleted).
+    :return: None
+    """
+    if _dialect() != "sqlite":
+        return
+    if not isinstance(task_ids, db.Select):
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+
+    db.session.execute(db.delete(TASK_FTS).where(TASK_FTS.c.rowid.in_(task_ids)))
+
+
+def rebuild_search_index():
+    """
+    Refill the full-text index from all tasks.
+
+    Used after the index was created on an existing database and after bulk
+    changes that bypass the service functions. Nothing to do on PostgreSQL.
+
+    :return: Number of indexed tasks, or None if the database keeps the index itself.
+    """
+    if _dialect() != "sqlite":
+        return None
+
+    db.session.execute(db.text("DELETE FROM task_fts"))
+    result = db.session.execute(db.text(
+        "INSERT INTO task_fts (rowid, title, comment, tags) SELECT id, title, comment, tags FROM task"
+    ))
+    db.session.commit()
+    return result.rowcount
+
+
+def search_terms(text):
+    """
+    Split a search string into lowercase words.
+
+    :param text: Search string entered by the user.
+    :return: List of at most MAX_SEARCH_TERMS words.
+    """
+    return re.findall(r"\w+", (text or "").lower())[:MAX_SEARCH_TERMS]
+
+
+def select_matches(terms):
+    """
+    Build a subquery of the tasks matching all search terms, with their rank.
+
+    Every term also matches as a prefix ("deplo" finds "deploy"). Titles
+    weigh more than tags, tags more than comments. A lower rank is a better
+    match on both databases.
+
+    :param terms: Words returned by search_terms().
+    :return: Subquery with task_id and rank columns.
+    """
+    if _dialect() == "sqlite":
+        sql = (
+            "SELECT rowid AS task_id, bm25(task_fts, 10.0, 1.0, 5.0) AS rank "
+            "FROM task_fts WHERE task_fts MATCH :query"
+        )
+        query = " ".join(f'"{term}"*' for term in terms)
+    else:
+        sql = (
+            f"SELECT task.id AS task_id, -ts_rank({POSTGRES_DOCUMENT}, to_tsquery('simple', :query)) AS rank "
+            f"FROM task WHERE {POSTGRES_DOCUMENT} @@ to_tsquery('simple', :query)"
+        )
+        query = " & ".join(f"{term}:*" for term in terms)
+
+    return (
+        db.text(sql)
+        .bindparams(query=query)
+        .columns(task_id=db.Integer, rank=db.Float)
+        .subquery("matches")
+    )
@@ -1,5 +1,38 @@
-from datetime import date
-from models.models import db, User, Task, Vacation
+from datetime import date, datetime
+from sqlalchemy import and_, or_, case, func
+from sqlalchemy.orm import joinedload
+from models.models import db, User, Task, Vacation, Tag, TaskTransition, task_tag, insert_on_conflict
+from models.events import record_change
+from models.search import index_tasks, unindex_tasks, search_terms, select_matches
+from models.cache import (
+    BOARD_VERSION,
+    USERS_VERSION,
+    bump_version,
+    get_version,
+    get_user_id,
+    get_user_ids,
+    get_usernames,
+    invalidate_user_directory
+)
+
+
+def record_board_change(entity, entity_id, action, payload=None, users_changed=False):
+    """
+    Record a change for the live board feed and invalidate cached boards.
+    Both are committed together with the change itself.
+
+    :param entity: Kind of the changed object (task, vacation, user).
+    :param entity_id: ID of the changed object.
+    :param action: Kind of change (create, update, delete).
+    :param payload: Optional JSON-serializable data to store with the event.
+    :param users_changed: True if users were added or deleted as well.
+    :return: None
+    """
+    record_change(entity, entity_id, action, payload)
+    if users_changed:
+        bump_version(BOARD_VERSION, USERS_VERSION)
+    else:
+        bump_version(BOARD_VERSION)
 
 
 def add_vacation(user_name, start_date, end_date, comment, status):
@@ -14,29 +47,60 @@ def add_vacation(user_name, start_date, end_date, comment, status):
     :return: None
     :raises ValueError: If the user is not found in the database.
     """
-    user = User.query.filter_by(username=user_name).first()
-    if not user:
+    user_id = get_user_id(user_name)
+    if not user_id:
         raise ValueError("User not found")
 
     vacation = Vacation(
-        user_id=user.id,
+        user_id=user_id,
         start_date=start_date,
         end_date=end_date,
         status=status,
         comment=comment
     )
     db.session.add(vacation)
+    db.session.flush()
+    record_board_change("vacation", vacation.id, "create")
     db.session.commit()
 
 
-def get_gantt_vacations():
+def get_gantt_vacations(start_date=None, end_date=None, username=None):
     """
-    Retrieve all vacations, ordered by username and start date.
+    Retrieve vacations overlapping a date range, ordered by username and start date.
     Useful for displaying a Gantt chart of vacations.
 
-    :return: List of Vacation objects.
+    The overlap test runs in SQL on the (start_date, end_date) and
+    (user_id, start_date) indexes, and only the columns the chart needs
+    are selected.
+
+    :param start_date: Optional start of the range; vacations ending earlier are skipped.
+    :param end_date: Optional end of the range; vacations starting later are skipped.
+    :param username: Optional username to filter by.
+    :return: List of rows with id, username, start_date, end_date, status and comment.
     """
-    return Vacation.query.join(User).order_by(User.username, Vacation.start_date).all()
+    query = (
+        db.select(
+            Vacation.id,
+            User.username,
+            Vacation.start_date,
+            Vacation.end_date,
+            Vacation.status,
+            Vacation.comment
+        )
+        .join(User, Vacation.user_id == User.id)
+        .order_by(User.username, Vacation.start_date)
+    )
+    if start_date:
+        query = query.where(Vacation.end_date >= start_date)
+    if end_date:
+        query = query.where(Vacation.start_date <= end_date)
+    if username:
+        user_id = get_user_id(username)
+        if user_id is None:
+            return []
+        query = query.where(Vacation.user_id == user_id)
+
+    return db.session.execute(query).all()
 
 
 def get_vacations(user_name=None):
@@ -46,23 +110,44 @@ def get_vacations(user_name=None):
     :param user_name: Username to filter by, or "all"/None for all users.
     :return: List of Vacation objects for the user(s).
     """
+    query = Vacation.query.options(joinedload(Vacation.user))
     if user_name == "all" or not user_name:
-        return Vacation.query.all()
-    user = User.query.filter_by(username=user_name).first()
-    return user.vacations if user else []
+        return query.all()
+    user_id = get_user_id(user_name)
+    return query.filter_by(user_id=user_id).all() if user_id else []
 
 
 def delete_vacation(vacation_id):
     """
-    Delete a vacation entry by its ID.
+    Delete a vacation entry by its ID with a single DELETE statement.
 
     :param vacation_id: ID of the vacation to delete.
-    :return: None
+    :return: True if the vacation was deleted, False if it does not exist.
+    """
+    deleted = db.session.execute(db.delete(Vacation).where(Vacation.id == vacation_id)).rowcount
+    if not deleted:
+        db.session.rollback()
+        return False
+
+    record_board_change("vacation", vacation_id, "delete")
+    db.session.commit()
+    return True
+
+
+def _insert_user(username):
     """
-    vacation = Vacation.query.get(vacation_id)
-    if vacation:
-        db.session.delete(vacation)
-        db.session.commit()
+    Insert a user unless the username is taken, with a single INSERT ... ON CONFLICT DO NOTHING.
+    Not committed.
+
+    :param username: The username of the user to add.
+    :return: ID of the new user, or None if the username already exists.
+    """
+    return db.session.execute(
+        insert_on_conflict(User)
+        .values(username=username)
+        .on_conflict_do_nothing(index_elements=[User.username])
+        .returning(User.id)
+    ).scalar()
 
 
 def add_user_to_db(username):
@@ -70,33 +155,41 @@ def add_user_to_db(username):
     Add a new user to the database if they do not already exist.
 
     :param username: The username of the user to add.
-    :return: None
+    :return: ID of the user.
     """
-    if not User.query.filter_by(username=username).first():
-        user = User(username=username)
-        db.session.add(user)
-        db.session.commit()
+    user_id = _insert_user(username)
+    if user_id is None:
+        db.session.rollback()
+        return get_user_id(username)
+
+    bump_version(USERS_VERSION, BOARD_VERSION)
+    db.session.commit()
+    invalidate_user_directory()
+    return user_id
 
 
 def edit_vacation(vacation_id, status, start_date, end_date, comment):
     """
-    Edit an existing vacation in the database.
+    Edit an existing vacation in the database with a single UPDATE statement.
 
     :param vacation_id: ID of the vacation to edit
     :param status: New status (todo, in_progress, waiting, done)
     :param start_date: New start date
     :param end_date: New end date
     :param comment: New comment
+    :return: True if the vacation was updated, False otherwise.
     """
     try:
-        vacation = Vacation.query.get(vacation_id)
-        if vacation:
-            vacation.status = status
-            vacation.start_date = start_date
-            vacation.end_date = end_date
-            vacation.comment = comment
+        updated = db.session.execute(
+            db.update(Vacation)
+            .where(Vacation.id == vacation_id)
+            .values(status=status, start_date=start_date, end_date=end_date, comment=comment)
+        ).rowcount
+        if updated:
+            record_board_change("vacation", vacation_id, "update")
             db.session.commit()
             return True
+        db.session.rollback()
         return False
     except Exception as e:
         db.session.rollback()
@@ -106,40 +199,139 @@ def edit_vacation(vacation_id, status, start_date, end_date, comment):
 
 def delete_user_from_db(username):
     """
-    Delete a user from the database.
+    Delete a user with their tasks and vacations.
+
+    The children are removed with set-based DELETE statements keyed on the
+    user ID, so the cost in statements and memory does not depend on the
+    number of tasks. The status history of the tasks is kept.
 
     :param username: The username of the user to delete.
+    :return: True if the user was deleted, False if it does not exist.
+    """
+    user_id = db.session.scalar(db.select(User.id).where(User.username == username))
+    if user_id is None:
+        return False
+
+    task_ids = db.select(Task.id).where(Task.user_id == user_id)
+    unindex_tasks(task_ids)
+    db.session.execute(db.delete(task_tag).where(task_tag.c.task_id.in_(task_ids)))
+    db.session.execute(db.delete(Task).where(Task.user_id == user_id))
+    db.session.execute(db.delete(Vacation).where(Vacation.user_id == user_id))
+    db.session.execute(db.delete(User).where(User.id == user_id))
+    record_board_change("user", user_id, "delete", {"username": username}, users_changed=True)
+    db.session.commit()
+    invalidate_user_directory()
+    return True
+
+
+def upsert_tags(names):
+    """
+    Get the IDs of the tags with the given names, creating the missing ones.
+
+    A single INSERT ... ON CONFLICT DO UPDATE ... RETURNING returns the IDs
+    of new and existing tags alike. Not committed.
+
+    :param names: List of tag names.
+    :return: List of tag IDs, without duplicates.
+    """
+    names = list(dict.fromkeys(name for name in names if name))
+    if not names:
+        return []
+
+    statement = insert_on_conflict(Tag).values([{"name": name} for name in names])
+    return db.session.scalars(
+        statement.on_conflict_do_update(index_elements=[Tag.name], set_={"name": statement.excluded.name})
+        .returning(Tag.id)
+    ).all()
+
+
+def set_task_tags(task_id, names, replace=True):
+    """
+    Link a task to the tags with the given names, creating the missing tags.
+    Not committed.
+
+    :param task_id: ID of the task.
+    :param names: List of tag names.
+    :param replace: Remove the current links of the task first.
     :return: None
     """
-    user = User.query.filter_by(username=username).first()
-    if user:
-        db.session.delete(user)
-        db.session.commit()
+    if replace:
+        db.session.execute(db.delete(task_tag).where(task_tag.c.task_id == task_id))
+    tag_ids = upsert_tags(names)
+    if tag_ids:
+        db.session.execute(task_tag.insert(), [{"task_id": task_id, "tag_id": tag_id} for tag_id in tag_ids])
+
+
+def select_task_rows():
+    """
+    Build a select of the task columns shown on the board, joined with the owner's username.
+
+    Executing it returns lightweight rows (named tuples) instead of ORM
+    objects: nothing is added to the identity map, no relationship is
+    loaded lazily, and only the columns a card needs are transferred.
+
+    :return: Select statement over task and user.
+    """
+    return db.select(
+        Task.id,
+        Task.title,
+        Task.status,
+        Task.type,
+        Task.priority,
+        Task.start_date,
+        Task.deadline,
+        Task.tags,
+        Task.task_type,
+        Task.status_date,
+        Task.comment,
+        User.username
+    ).join(User, Task.user_id == User.id)
+
+
+def filter_by_tag(query, tag):
+    """
+    Restrict a Task query to tasks with the given tag.
+
+    The lookup goes through the unique tag name and the (tag_id, task_id)
+    index of the association table instead of scanning ``Task.tags``.
+
+    :param query: Task query or select statement to filter.
+    :param tag: Tag name, or None to leave the query unchanged.
+    :return: Filtered query.
+    """
+    if not tag:
+        return query
+    tagged_ids = db.select(task_tag.c.task_id).join(Tag).where(Tag.name == tag)
+    return query.filter(Task.id.in_(tagged_ids))
 
 
-def get_tasks_from_db(username):
+def get_tasks_from_db(username, tag=None):
     """
     Retrieve all tasks for a given user, organized by status.
     If the user does not exist, they will be created.
 
     :param username: The username of the user whose tasks to retrieve.
-    :return: Dictionary of tasks grouped by status:
+    :param tag: Optional tag name to filter by.
+    :return: Dictionary of task rows grouped by status:
              {"todo": [], "in_progress": [], "waiting": [], "done": []}
     """
-    user = User.query.filter_by(username=username).first()
-    if not user:
-        add_user_to_db(username)
-        user = User.query.filter_by(username=username).first()
-    tasks = {"todo": [], "in_progress": [], "waiting": [], "done": []}
-    for task in user.tasks:
-        tasks[task.status].append(task)
-    return tasks
+    user_id = get_user_id(username)
+    if user_id is None:
+        user_id = add_user_to_db(username)
+    query = select_task_rows().where(Task.user_id == user_id)
+    tasks = db.session.execute(filter_by_tag(query, tag)).all()
+    return group_tasks_by_status(tasks)
 
 
 def add_task_to_db(username, title, status, type_, priority, start_date, deadline, tags, task_type, comment):
     """
     Add a new task to the database for a specific user.
 
+    Nothing is read before writing: the user ID comes from the cached user
+    directory (a missing user is inserted in the same transaction), and the
+    task, its tags, status history, search entry and change event are
+    written with one statement each and a single commit.
+
     :param username: The username of the task owner.
     :param title: The title of the task.
     :param status: The status of the task (todo, in_progress, waiting, done).
@@ -150,108 +342,385 @@ def add_task_to_db(username, title, status, type_, priority, start_date, deadlin
     :param tags: List of tags associated with the task.
     :param task_type: The category of the task (AD-HOC, PRO, REG).
     :param comment: Additional comments for the task.
-    :return: None
+    :return: ID of the new task.
     """
-    user = User.query.filter_by(username=username).first()
-    if not user:
-        add_user_to_db(username)
-        user = User.query.filter_by(username=username).first()
-
-    task = Task(
-        title=title,
-        status=status,
-        type=type_,
-        priority=priority,
-        start_date=start_date,
-        deadline=deadline if deadline else None,
-        tags=",".join(tags),
+    user_id = get_user_id(username)
+    new_user = user_id is None
+    if new_user:
+        user_id = _insert_user(username) or db.session.scalar(db.select(User.id).filter_by(username=username))
+
+    task_id = db.session.execute(
+        db.insert(Task).values(
+            title=title,
+            status=status,
+            type=type_,
+            priority=priority,
+            start_date=start_date,
+            deadline=deadline if deadline else None,
+            tags=",".join(tags),
+            task_type=task_type,
+            user_id=user_id,
+            status_date=date.today(),
+            comment=comment
+        ).returning(Task.id)
+    ).scalar()
+    set_task_tags(task_id, tags, replace=False)
+    db.session.execute(db.insert(TaskTransition).values(
+        task_id=task_id,
+        user_id=user_id,
         task_type=task_type,
-        user=user,
-        status_date=date.today(),
-        comment=comment
-    )
-    db.session.add(task)
+        from_status=None,
+        to_status=status,
+        changed_at=datetime.utcnow()
+    ))
+    index_tasks([task_id], new=True)
+    record_board_change("task", task_id, "create", users_changed=new_user)
     db.session.commit()
+    if new_user:
+        invalidate_user_directory()
+    return task_id
 
 
 def edit_task_in_db(task_id, data):
     """
-    Edit an existing task in the database.
+    Edit an existing task in the database without loading it.
+    A status change is appended to the transition log and resets the status date.
 
     :param task_id: ID of the task to edit.
-    :param data: Dictionary containing task fields to update.
-    :return: None
+    :param data: Dictionary containing task fields to update. A missing
+                 status or deadline keeps the current value.
+    :return: True if the task was updated, False if it does not exist.
+    """
+    fields = {key: value for key, value in data.items() if key not in ("status", "deadline") or value}
+    return _update_task(task_id, fields)
+
+
+def _update_task(task_id, fields):
     """
-    task = Task.query.get(task_id)
-    if task:
-        task.title = data.get("title", task.title)
-        task.status = data.get("status", task.status)
-        task.type = data.get("type", task.type)
-        task.priority = data.get("priority", task.priority)
-        task.start_date = data.get("start_date", task.start_date)
-        task.deadline = data.get("deadline") or task.deadline
-        task.tags = ",".join(data.get("tags", task.tags.split(",")))
-        task.task_type = data.get("task_type", task.task_type)
-        task.comment = data.get("comment", task.comment)
-        task.status_date = date.today()
-        db.session.commit()
+    Update selected fields of a task by primary key, without loading it.
+
+    The fields are changed with a single UPDATE statement. The status date
+    is reset only if the status actually changes, in which case the
+    transition is appended to the log by an INSERT ... SELECT that reads
+    the previous status in the database. Committed once.
+
+    :param task_id: ID of the task to update.
+    :param fields: Dictionary of task fields to change (title, status, type,
+                   priority, start_date, deadline, tags, task_type, comment).
+    :return: True if the task was updated, False if it does not exist.
+    """
+    values = {key: value for key, value in fields.items() if key != "tags"}
+    if "tags" in fields:
+        values["tags"] = ",".join(fields["tags"])
+    if not values:
+        return db.session.get(Task, task_id) is not None
+
+    if "status" in values:
+        db.session.execute(db.insert(TaskTransition).from_select(
+            ["task_id", "user_id", "task_type", "from_status", "to_status", "changed_at"],
+            db.select(
+                Task.id,
+                Task.user_id,
+                db.literal(values["task_type"]) if "task_type" in values else Task.task_type,
+                Task.status,
+                db.literal(values["status"]),
+                db.literal(datetime.utcnow(), db.DateTime)
+            ).where(Task.id == task_id, Task.status != values["status"])
+        ))
+        values["status_date"] = case(
+            (Task.status != values["status"], date.today()),
+            else_=Task.status_date
+        )
+
+    updated = db.session.execute(db.update(Task).where(Task.id == task_id).values(values)).rowcount
+    if not updated:
+        db.session.rollback()
+        return False
+
+    if "tags" in fields:
+        set_task_tags(task_id, fields["tags"])
+    if fields.keys() & {"title", "comment", "tags"}:
+        index_tasks([task_id])
+
+    record_board_change("task", task_id, "update")
+    db.session.commit()
+    return True
+
+
+def update_task_fields(task_id, fields):
+    """
+    Update selected fields of a task and return the updated card.
+
+    :param task_id: ID of the task to update.
+    :param fields: Dictionary of task fields to change (title, status, type,
+                   priority, start_date, deadline, tags, task_type, comment).
+    :return: Updated task row, or None if the task does not exist.
+    """
+    if not _update_task(task_id, fields):
+        return None
+    return get_task_row(task_id)
+
+
+def get_task_row(task_id):
+    """
+    Retrieve the full card data of a single task.
+
+    :param task_id: ID of the task.
+    :return: Task row as built by select_task_rows(), or None if the task does not exist.
+    """
+    return db.session.execute(select_task_rows().where(Task.id == task_id)).first()
 
 
 def delete_task_from_db(task_id):
     """
-    Delete a task from the database.
+    Delete a task and its tag links by primary key, without loading it.
+    The status history of the task is kept.
 
     :param task_id: ID of the task to delete.
-    :return: None
+    :return: True if the task was deleted, False if it does not exist.
     """
-    task = Task.query.get(task_id)
-    if task:
-        db.session.delete(task)
-        db.session.commit()
+    db.session.execute(db.delete(task_tag).where(task_tag.c.task_id == task_id))
+    deleted = db.session.execute(db.delete(Task).where(Task.id == task_id)).rowcount
+    if not deleted:
+        db.session.rollback()
+        return False
+
+    unindex_tasks([task_id])
+    record_board_change("task", task_id, "delete")
+    db.session.commit()
+    return True
 
 
-def get_tasks_by_category(category):
+def get_tasks_by_category(category, tag=None):
     """
     Retrieve tasks by category, grouped by status.
 
     :param category: Task category (AD-HOC, PRO, REG, etc.).
-    :return: Dictionary of tasks grouped by status.
+    :param tag: Optional tag name to filter by.
+    :return: Dictionary of task rows grouped by status.
     """
-    tasks = Task.query.filter_by(task_type=category).all()
+    query = select_task_rows().where(Task.task_type == category)
+    tasks = db.session.execute(filter_by_tag(query, tag)).all()
     return group_tasks_by_status(tasks)
 
 
-def get_tasks_by_category_and_user(category, username):
+def get_tasks_by_category_and_user(category, username, tag=None):
     """
     Retrieve tasks for a specific user and category, grouped by status.
 
     :param category: Task category (AD-HOC, PRO, REG, etc.).
     :param username: Username of the task owner.
-    :return: Dictionary of tasks grouped by status, or empty dict if user not found.
+    :param tag: Optional tag name to filter by.
+    :return: Dictionary of task rows grouped by status, or empty dict if user not found.
     """
-    user = User.query.filter_by(username=username).first()
-    if not user:
+    user_id = get_user_id(username)
+    if user_id is None:
         return {}
 
-    tasks = Task.query.filter_by(user_id=user.id, task_type=category).all()
+    query = select_task_rows().where(Task.user_id == user_id, Task.task_type == category)
+    tasks = db.session.execute(filter_by_tag(query, tag)).all()
     return group_tasks_by_status(tasks)
 
 
-def get_all_tasks():
+def get_all_tasks(tag=None):
     """
     Retrieve all tasks in the database, grouped by status.
+    Task owners are loaded in the same statement.
 
-    :return: Dictionary of tasks grouped by status.
+    :param tag: Optional tag name to filter by.
+    :return: Dictionary of task rows grouped by status.
     """
-    tasks = Task.query.all()
+    tasks = db.session.execute(filter_by_tag(select_task_rows(), tag)).all()
     return group_tasks_by_status(tasks)
 
 
+def iter_tasks(category=None, username=None, tag=None, batch_size=1000):
+    """
+    Stream task rows for exports, in ID order, without loading them all.
+
+    Rows are fetched ``batch_size`` at a time (``yield_per``), which uses a
+    server-side cursor on PostgreSQL, so memory stays constant whatever the
+    number of tasks.
+
+    :param category: Optional task category (AD-HOC, PRO, REG) to filter by.
+    :param username: Optional username of the task owner to filter by.
+    :param tag: Optional tag name to filter by.
+    :param batch_size: Number of rows fetched at a time.
+    :return: Iterator over task rows as built by select_task_rows().
+    """
+    query = select_task_rows()
+    if category:
+        query = query.where(Task.task_type == category)
+    if username:
+        user_id = get_user_id(username)
+        if user_id is None:
+            return
+        query = query.where(Task.user_id == user_id)
+    query = filter_by_tag(query, tag).order_by(Task.id).execution_options(yield_per=batch_size)
+
+    yield from db.session.execute(query)
+
+
+def get_tasks_page(status, category=None, username=None, after=None, limit=50, tag=None):
+    """
+    Retrieve one page of a status column using keyset pagination.
+
+    Tasks are ordered by status date and ID, newest first. Instead of an
+    OFFSET, the next page starts strictly after the ``(status_date, id)``
+    pair of the last task already shown, so every page costs the same
+    regardless of how deep into the column it is.
+
+    :param status: Column to read (todo, in_progress, waiting, done).
+    :param category: Optional task category (AD-HOC, PRO, REG) to filter by.
+    :param username: Optional username of the task owner to filter by.
+    :param after: Optional ``(status_date, id)`` tuple of the last task already shown.
+    :param limit: Maximum number of tasks to return.
+    :param tag: Optional tag name to filter by.
+    :return: Tuple of (list of task rows, ``(status_date, id)`` cursor of the
+             next page or None if this is the last page).
+    """
+    query = select_task_rows().where(Task.status == status)
+    if category:
+        query = query.where(Task.task_type == category)
+    if username:
+        user_id = get_user_id(username)
+        if user_id is None:
+            return [], None
+        query = query.where(Task.user_id == user_id)
+    query = filter_by_tag(query, tag)
+    if after:
+        after_date, after_id = after
+        query = query.where(or_(
+            Task.status_date < after_date,
+            and_(Task.status_date == after_date, Task.id < after_id)
+        ))
+
+    query = query.order_by(Task.status_date.desc(), Task.id.desc()).limit(limit + 1)
+    tasks = db.session.execute(query).all()
+    if len(tasks) <= limit:
+        return tasks, None
+
+    tasks = tasks[:limit]
+    return tasks, (tasks[-1].status_date, tasks[-1].id)
+
+
+def search_tasks(text, page=1, limit=20):
+    """
+    Full-text search over task titles, comments and tags.
+
+    Results are ordered by relevance, best match first, then by ID.
+
+    :param text: Search string; every word must match (as a prefix).
+    :param page: Page number, starting at 1.
+    :param limit: Number of tasks per page.
+    :return: Tuple of (list of task rows, True if there are more pages).
+    """
+    terms = search_terms(text)
+    if not terms:
+        return [], False
+
+    matches = select_matches(terms)
+    query = (
+        select_task_rows()
+        .join(matches, matches.c.task_id == Task.id)
+        .order_by(matches.c.rank, Task.id)
+        .offset((page - 1) * limit)
+        .limit(limit + 1)
+    )
+    tasks = db.session.execute(query).all()
+    return tasks[:limit], len(tasks) > limit
+
+
+def get_task_summary(category=None, username=None, tag=None):
+    """
+    Compute card counts for column headers and the dashboard in one GROUP BY query.
+
+    Tasks are grouped by (status, category, owner) in the database and the
+    few resulting groups are folded into the separate breakdowns. A task is
+    overdue if its deadline has passed and it is not done.
+
+    :param category: Optional task category (AD-HOC, PRO, REG) to filter by.
+    :param username: Optional username of the task owner to filter by.
+    :param tag: Optional tag name to filter by.
+    :return: Dictionary with total, overdue, by_status, by_category, by_user
+             and overdue_by_user counts.
+    """
+    summary = {
+        "total": 0,
+        "overdue": 0,
+        "by_status": {"todo": 0, "in_progress": 0, "waiting": 0, "done": 0},
+        "by_category": {},
+        "by_user": {},
+        "overdue_by_user": {}
+    }
+
+    overdue = func.sum(case(
+        (and_(Task.deadline < date.today(), Task.status != "done"), 1),
+        else_=0
+    ))
+    query = (
+        db.select(Task.status, Task.task_type, Task.user_id, func.count(Task.id), overdue)
+        .group_by(Task.status, Task.task_type, Task.user_id)
+    )
+    if category:
+        query = query.where(Task.task_type == category)
+    if username:
+        user_id = get_user_id(username)
+        if user_id is None:
+            return summary
+        query = query.where(Task.user_id == user_id)
+    query = filter_by_tag(query, tag)
+
+    usernames = {user_id: name for name, user_id in get_user_ids().items()}
+    for status, task_type, user_id, count, overdue_count in db.session.execute(query):
+        name = usernames.get(user_id, str(user_id))
+        overdue_count = overdue_count or 0
+        summary["total"] += count
+        summary["overdue"] += overdue_count
+        summary["by_status"][status] = summary["by_status"].get(status, 0) + count
+        summary["by_category"][task_type] = summary["by_category"].get(task_type, 0) + count
+        summary["by_user"][name] = summary["by_user"].get(name, 0) + count
+        if overdue_count:
+            summary["overdue_by_user"][name] = summary["overdue_by_user"].get(name, 0) + overdue_count
+    return summary
+
+
+def get_board_version():
+    """
+    Get the version of the board data, increased by every write function.
+
+    :return: Version number.
+    """
+    return get_version(BOARD_VERSION)
+
+
+def get_tasks_by_ids(task_ids):
+    """
+    Retrieve task rows by their IDs.
+
+    :param task_ids: Iterable of task IDs.
+    :return: Dictionary mapping task ID to task row; missing tasks are left out.
+    """
+    tasks = db.session.execute(select_task_rows().where(Task.id.in_(list(task_ids)))).all()
+    return {task.id: task for task in tasks}
+
+
+def get_vacations_by_ids(vacation_ids):
+    """
+    Retrieve vacations by their IDs with their owners loaded.
+
+    :param vacation_ids: Iterable of vacation IDs.
+    :return: Dictionary mapping vacation ID to Vacation object; missing vacations are left out.
+    """
+    vacations = Vacation.query.options(joinedload(Vacation.user)).filter(Vacation.id.in_(list(vacation_ids))).all()
+    return {vacation.id: vacation for vacation in vacations}
+
+
 def group_tasks_by_status(tasks):
     """
-    Group a list of Task objects by their status.
+    Group a list of tasks by their status.
 
-    :param tasks: List of Task objects.
+    :param tasks: List of Task objects or task rows.
     :return: Dictionary of tasks grouped by status:
              {"todo": [], "in_progress": [], "waiting": [], "done": []}
     """
@@ -0,0 +1,183 @@
+import gzip
+import json
+import time
+from datetime import date, datetime
+from models.models import (
+    db, User, Task, Vacation, Tag, TaskTransition, TaskArchive, ChangeEvent, task_tag, migrate_tags, migrate_transitions
+)
+from models.search import rebuild_search_index
+from models.cache import BOARD_VERSION, USERS_VERSION, bump_version, invalidate_user_directory
+
+SNAPSHOT_FORMAT = "kanban-snapshot"
+SNAPSHOT_VERSION = 1
+
+# Restored in this order, so owners exist before the rows that point to them.
+# The tag tables and the search index are derived from the tasks on restore.
+SNAPSHOT_TABLES = [User.__table__, Task.__table__, Vacation.__table__, TaskTransition.__table__]
+
+# Not in the snapshot but cleared on replace: archived tasks keep their IDs,
+# which restored tasks may use, and events would point to unrelated rows.
+CLEARED_TABLES = [TaskArchive.__table__, ChangeEvent.__table__]
+
+
+def _encode(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def _decoders(table):
+    """
+    Build the functions converting the JSON values of a table back to column values.
+
+    :param table: Table of the snapshot.
+    :return: List of functions, one per column, in column order.
+    """
+    decoders = []
+    for column in table.columns:
+        python_type = column.type.python_type
+        if python_type is datetime:
+            decoders.append(lambda value: datetime.fromisoformat(value) if value is not None else None)
+        elif python_type is date:
+            decoders.append(lambda value: date.fromisoformat(value) if value is not None else None)
+        else:
+            decoders.append(lambda value: value)
+    return decoders
+
+
+def create_snapshot(path, batch_size=5000):
+    """
+    Write the users, tasks, vacations and task status history to a snapshot file.
+
+    The file is gzip-compressed JSON Lines: a header with the format version
+    and the columns of every table, then one ``[table, values]`` line per
+    row. Rows are read with ``yield_per``, so memory does not grow with the
+    size of the database.
+
+    Must be called inside an application context.
+
+    :param path: Path of the file to write.
+    :param batch_size: Number of rows fetched at a time.
+    :return: Dictionary with the number of rows per table.
+    """
+    counts = {}
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "created": datetime.utcnow().isoformat(timespec="seconds"),
+            "tables": {table.name: [column.name for column in table.columns] for table in SNAPSHOT_TABLES}
+        }
+        f.write(json.dumps(header) + "\n")
+
+        for table in SNAPSHOT_TABLES:
+            counts[table.name] = 0
+            rows = db.session.execute(
+                db.select(table).order_by(*table.primary_key.columns).execution_options(yield_per=batch_size)
+            )
+            for row in rows:
+                f.write(json.dumps([table.name, [_encode(value) for value in row]], ensure_ascii=False) + "\n")
+                counts[table.name] += 1
+
+    return counts
+
+
+def _clear_tables():
+    """
+    Delete all rows of the restored and derived tables, the task archive
+    and the change log. Not committed.
+
+    :return: None
+    """
+    for table in CLEARED_TABLES + [task_tag, Tag.__table__] + SNAPSHOT_TABLES[::-1]:
+        db.session.execute(db.delete(table))
+
+
+def _reset_sequences():
+    """
+    Move the ID sequences past the restored IDs. Only needed on PostgreSQL,
+    SQLite continues after the highest ID by itself.
+
+    :return: None
+    """
+    if db.session.get_bind().dialect.name != "postgresql":
+        return
+    for table in SNAPSHOT_TABLES:
+        db.session.execute(db.text(
+            f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', 'id'), "
+            f"coalesce((SELECT max(id) FROM \"{table.name}\"), 0) + 1, false)"
+        ))
+
+
+def restore_snapshot(path, replace=False, batch_size=5000):
+    """
+    Load a snapshot file into the database.
+
+    The file is read line by line and rows are inserted ``batch_size`` at a
+    time with Core executemany statements, without ORM objects. Tag tables,
+    the search index and the status history of tasks missing from the
+    snapshot are rebuilt from the tasks afterwards.
+
+    Must be called inside an application context.
+
+    :param path: Path of a file written by create_snapshot().
+    :param replace: Delete the existing users, tasks, vacations, archived tasks
+                    and change events first. Without it, restoring into a
+                    database with any users, tasks, vacations, status history
+                    or archived tasks fails.
+    :param batch_size: Number of rows per INSERT.
+    :return: Dictionary with the number of rows per table and the duration.
+    :raises ValueError: If the file is not a supported snapshot or the database is not empty.
+    """
+    start = time.perf_counter()
+    tables = {table.name: table for table in SNAPSHOT_TABLES}
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a snapshot")
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {header.get('version')}")
+
+        if replace:
+            _clear_tables()
+        elif any(
+            db.session.scalar(db.select(table.c.id).limit(1)) is not None
+            for table in SNAPSHOT_TABLES + [TaskArchive.__table__]
+        ):
+            raise ValueError("The database is not empty, use --replace to overwrite it")
+
+        # Columns missing from an older snapshot get their defaults, dropped columns are skipped
+        columns = {}
+        for name, names in header["tables"].items():
+            table = tables[name]
+            decoders = dict(zip([column.name for column in table.columns], _decoders(table)))
+            columns[name] = [
+                (position, column, decoders[column]) for position, column in enumerate(names) if column in decoders
+            ]
+
+        counts = {name: 0 for name in tables}
+        batch, batch_table = [], None
+        for line in f:
+            name, values = json.loads(line)
+            if name != batch_table and batch:
+                db.session.execute(tables[batch_table].insert(), batch)
+                batch = []
+            batch_table = name
+            batch.append({column: decode(values[position]) for position, column, decode in columns[name]})
+            counts[name] += 1
+            if len(batch) >= batch_size:
+                db.session.execute(tables[name].insert(), batch)
+                batch = []
+        if batch:
+            db.session.execute(tables[batch_table].insert(), batch)
+
+    _reset_sequences()
+    bump_version(USERS_VERSION, BOARD_VERSION)
+    db.session.commit()
+    invalidate_user_directory()
+
+    migrate_tags()
+    migrate_transitions()
+    rebuild_search_index()
+
+    counts["seconds"] = round(time.perf_counter() - start, 3)
+    return counts
@@ -1,6 +1,29 @@
+import csv
+import gzip
+import io
+import hashlib
+import json
+import os
+import time
 from datetime import date, datetime, timedelta
-from flask import render_template, redirect, url_for
+from flask import render_template, redirect, url_for, jsonify, request, make_response, Response, stream_with_context
 import models.services as svc
+import models.events as events
+import models.archive as archive
+from models.models import db
+from models.cache import render_cache
+
+STATUSES = ["todo", "in_progress", "waiting", "done"]
+BOARD_PAGE_SIZE = 50
+# Maximum lengths of the task columns with a size limit
+TASK_FIELD_LENGTHS = {"title": 200, "type": 20, "priority": 20, "task_type": 20}
+# Event IDs re-read on every poll of the change log, see stream_changes()
+CHANGE_REPLAY_WINDOW = 200
+EXPORT_FIELDS = [
+    "id", "title", "status", "type", "priority", "start_date", "deadline",
+    "tags", "task_type", "status_date", "comment", "username"
+]
+EXPORT_FORMATS = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
 
 
 def parse_custom_date(date_str):
@@ -23,41 +46,291 @@ def parse_custom_date(date_str):
     raise ValueError(f"Invalid date format: {date_str}")
 
 
+def encode_cursor(cursor):
+    """
+    Encodes a keyset pagination cursor for use in URLs
+
+    Args:
+        cursor: Tuple of (status_date, task id) or None
+
+    Returns:
+        String in the format yyyy-mm-dd:id or None
+    """
+    if not cursor:
+        return None
+    status_date, task_id = cursor
+    return f"{status_date.isoformat()}:{task_id}"
+
+
+def decode_cursor(value):
+    """
+    Decodes a cursor produced by encode_cursor
+
+    Args:
+        value: String in the format yyyy-mm-dd:id
+
+    Returns:
+        Tuple of (status_date, task id) or None
+    """
+    if not value:
+        return None
+    date_str, _, task_id = value.partition(":")
+    return parse_custom_date(date_str), int(task_id)
+
+
+def _build_token():
+    """
+    Identifies the deployed templates and static files
+
+    BUILD_ID is used if it is set; otherwise the files are hashed, which gives
+    every worker of a deploy the same token.
+
+    Returns:
+        Short hex string that changes when the templates or static files change
+    """
+    if os.environ.get("BUILD_ID"):
+        return os.environ["BUILD_ID"]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha1()
+    for folder in ("templates", "static"):
+        for path, _, names in sorted(os.walk(os.path.join(root, folder))):
+            for name in sorted(names):
+                with open(os.path.join(path, name), "rb") as f:
+                    digest.update(name.encode())
+                    digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+BUILD_TOKEN = _build_token()
+
+
+def render_cached(key, render):
+    """
+    Serves a page from the render cache, rendering it on a miss
+
+    The ETag is derived from the key and BUILD_TOKEN, so a browser that
+    already has the current version of the page gets 304 Not Modified
+    without rendering, and a deploy with new templates or scripts serves
+    fresh pages.
+
+    Args:
+        key: Tuple identifying the page, including the data version it depends on
+        render: Function that renders the page; redirects are passed through uncached
+
+    Returns:
+        Response with the page, or 304 Not Modified
+    """
+    key = (BUILD_TOKEN,) + tuple(key)
+    etag = hashlib.sha1(repr(key).encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        render_cache.count_not_modified()
+        response = make_response("", 304)
+    else:
+        body = render_cache.get(key)
+        if body is None:
+            body = render()
+            if not isinstance(body, str):
+                return body
+            render_cache.put(key, body)
+        response = make_response(body)
+
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def compressed_json(data):
+    """
+    Builds a JSON response, gzip-compressed if the client accepts it
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Response with the JSON body
+    """
+    body = json.dumps(data, separators=(",", ":"), default=str).encode()
+    response = make_response(body)
+    response.mimetype = "application/json"
+    response.vary.add("Accept-Encoding")
+
+    if request.accept_encodings["gzip"] and len(body) > 1024:
+        response.set_data(gzip.compress(body, compresslevel=5))
+        response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+def format_task_for_display(t, today):
+    """
+    Formats a single task for display on the frontend
+
+    Args:
+        t: Task row as returned by svc.select_task_rows()
+        today: Current date
+
+    Returns:
+        Dictionary with the card data
+    """
+    status_date = t.status_date or today
+    return {
+        "id": t.id,
+        "title": t.title,
+        "status": t.status,
+        "type": t.type,
+        "priority": t.priority,
+        "start_date": t.start_date.isoformat() if t.start_date else None,
+        "deadline": t.deadline.isoformat() if t.deadline else None,
+        "tags": t.tags,
+        "task_type": t.task_type,
+        "status_date": status_date.isoformat(),
+        "days_in_status": (today - status_date).days,
+        "comment": t.comment,
+        "username": t.username
+    }
+
+
+def format_task_summary(t, today):
+    """
+    Formats the part of a task shown on a board card
+
+    The remaining fields (comment, dates, tags...) are loaded with
+    handle_task_details() when the card is opened.
+
+    Args:
+        t: Task row as returned by svc.select_task_rows()
+        today: Current date
+
+    Returns:
+        Dictionary with the card summary
+    """
+    status_date = t.status_date or today
+    return {
+        "id": t.id,
+        "title": t.title,
+        "status": t.status,
+        "status_date": status_date.isoformat(),
+        "days_in_status": (today - status_date).days,
+        "username": t.username
+    }
+
+
 def format_tasks_for_display(tasks_objs, today):
     """
-    Formats tasks for display on the frontend
+    Formats tasks for the board columns, as card summaries
 
     Args:
-        tasks_objs: Dictionary of tasks by status
+        tasks_objs: Dictionary of task rows by status
         today: Current date
 
     Returns:
         Formatted dictionary of tasks
     """
     tasks = {}
-    for col in ["todo", "in_progress", "waiting", "done"]:
-        tasks[col] = []
-        for t in tasks_objs.get(col, []):
-            status_date = t.status_date or today
-            tasks[col].append({
-                "id": t.id,
-                "title": t.title,
-                "status": t.status,
-                "type": t.type,
-                "priority": t.priority,
-                "start_date": t.start_date.isoformat() if t.start_date else None,
-                "deadline": t.deadline.isoformat() if t.deadline else None,
-                "tags": t.tags,
-                "task_type": t.task_type,
-                "status_date": status_date,
-                "days_in_status": (today - status_date).days,
-                "comment": t.comment,
-                "username": t.user.username
-            })
+    for col in STATUSES:
+        tasks[col] = [format_task_summary(t, today) for t in tasks_objs.get(col, [])]
     return tasks
 
 
-def handle_users_view(selected_user, users, view):
+def parse_task_fields(data):
+    """
+    Validates and converts task fields sent by the board
+
+    Only the fields present in data are returned, so the result can be used
+    for partial updates. Values must be strings (tags may also be a list of
+    strings), dates and nullable fields may be empty.
+
+    Args:
+        data: Dictionary of raw field values (JSON body or form)
+
+    Returns:
+        Dictionary of converted field values
+
+    Raises:
+        ValueError: If data is not a dictionary or a field has an invalid value
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Expected an object of task fields")
+
+    for name in TASK_FIELD_LENGTHS.keys() | {"status", "start_date", "deadline", "comment"}:
+        value = data.get(name)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{name} must be a string")
+
+    fields = {}
+    for name in ["title", "type", "priority", "task_type", "comment"]:
+        if name in data:
+            fields[name] = data[name]
+
+    if "title" in fields and not fields["title"]:
+        raise ValueError("Title cannot be empty")
+    for name, length in TASK_FIELD_LENGTHS.items():
+        if fields.get(name) and len(fields[name]) > length:
+            raise ValueError(f"{name} is longer than {length} characters")
+
+    if "status" in data:
+        if data["status"] not in STATUSES:
+            raise ValueError(f"Unknown status: {data['status']}")
+        fields["status"] = data["status"]
+
+    if "start_date" in data:
+        fields["start_date"] = parse_custom_date(data["start_date"])
+    if "deadline" in data:
+        fields["deadline"] = parse_custom_date(data["deadline"])
+
+    if "tags" in data:
+        tags = data["tags"]
+        if tags is None:
+            tags = []
+        elif isinstance(tags, str):
+            tags = tags.split(",")
+        elif not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise ValueError("tags must be a string or a list of strings")
+        fields["tags"] = [tag.strip() for tag in tags if tag.strip()]
+
+    return fields
+
+
+def handle_task_update(task_id, data):
+    """
+    Updates a task in place and returns the updated card
+
+    Args:
+        task_id: ID of the task to update
+        data: Dictionary of raw field values to change
+
+    Returns:
+        JSON response with the updated card
+    """
+    try:
+        fields = parse_task_fields(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    task = svc.update_task_fields(task_id, fields)
+    if not task:
+        return jsonify({"error": "Task not found"}), 404
+
+    return jsonify(format_task_for_display(task, date.today()))
+
+
+def handle_task_details(task_id):
+    """
+    Returns the full data of a task for the sidebar
+
+    Args:
+        task_id: ID of the task
+
+    Returns:
+        JSON response with the task, or an error with status 404
+    """
+    task = svc.get_task_row(task_id)
+    if not task:
+        return jsonify({"error": "Task not found"}), 404
+
+    return jsonify(format_task_for_display(task, date.today()))
+
+
+def handle_users_view(selected_user, users, view, tag=None):
     """
     Handles the standard users view
 
@@ -65,6 +338,7 @@ def handle_users_view(selected_user, users, view):
         selected_user: Selected user
         users: List of all users
         view: Current view
+        tag: Optional tag to filter tasks by
 
     Returns:
         Rendered template
@@ -76,9 +350,9 @@ def handle_users_view(selected_user, users, view):
     if not selected_user or selected_user == "all":
         selected_user = users[0] if users else None
     elif selected_user == "all":
-        return redirect(url_for("index", user=users[0] if users else None, view=view))
+        return redirect(url_for(".index", user=users[0] if users else None, view=view))
 
-    tasks_objs = svc.get_tasks_from_db(selected_user)
+    tasks_objs = svc.get_tasks_from_db(selected_user, tag)
     today = date.today()
 
     tasks = format_tasks_for_display(tasks_objs, today)
@@ -89,10 +363,41 @@ def handle_users_view(selected_user, users, view):
         selected_user=selected_user,
         users=users,
         today=today.isoformat(),
-        view=view
+        view=view,
+        tag=tag
     )
 
 
+def format_vacation_for_display(v, today):
+    """
+    Formats a single vacation for display on the frontend
+
+    Args:
+        v: Vacation object
+        today: Current date
+
+    Returns:
+        Dictionary with the card data; unknown statuses are shown as todo
+    """
+    start_date_str = v.start_date.strftime("%d.%m.%Y")
+    end_date_str = v.end_date.strftime("%d.%m.%Y")
+
+    col = v.status if v.status in STATUSES else "todo"
+
+    return {
+        "id": v.id,
+        "title": f"{v.user.username}",
+        "date_range": f"{start_date_str} - {end_date_str}",
+        "status": col,
+        "start_date": v.start_date.isoformat(),
+        "end_date": v.end_date.isoformat(),
+        "comment": v.comment,
+        "username": v.user.username,
+        "is_vacation": True,
+        "highlight": col == "todo" and v.start_date <= today + timedelta(days=7)
+    }
+
+
 def handle_vacation_view(selected_user, users, view):
     """
     Handles the vacation view
@@ -126,30 +431,8 @@ def handle_vacation_view(selected_user, users, view):
     tasks = {"todo": [], "in_progress": [], "waiting": [], "done": []}
 
     for v in vacations_objs:
-        start_date_str = v.start_date.strftime("%d.%m.%Y")
-        end_date_str = v.end_date.strftime("%d.%m.%Y")
-
-        title = f"{v.user.username}"
-        date_range = f"{start_date_str} - {end_date_str}"
-
-        col = v.status if v.status in tasks else "todo"
-
-        highlight = False
-        if col == "todo" and (v.start_date <= today + timedelta(days=7)):
-            highlight = True
-
-        tasks[col].append({
-            "id": v.id,
-            "title": title,
-            "date_range": date_range,
-            "status": v.status,
-            "start_date": v.start_date.isoformat(),
-            "end_date": v.end_date.isoformat(),
-            "comment": v.comment,
-            "username": v.user.username,
-            "is_vacation": True,
-            "highlight": highlight
-        })
+        vacation = format_vacation_for_display(v, today)
+        tasks[vacation["status"]].append(vacation)
 
     return render_template(
         "index.html",
@@ -161,7 +444,7 @@ def handle_vacation_view(selected_user, users, view):
     )
 
 
-def handle_category_view(category, selected_user, users, view):
+def handle_category_view(category, selected_user, users, view, tag=None):
     """
     Handles the view for categories AD-HOC, REG, PRO
 
@@ -170,6 +453,7 @@ def handle_category_view(category, selected_user, users, view):
         selected_user: Selected user
         users: List of all users
         view: Current view
+        tag: Optional tag to filter tasks by
 
     Returns:
         Rendered template
@@ -178,9 +462,9 @@ def handle_category_view(category, selected_user, users, view):
         selected_user = "all"
 
     if selected_user == "all":
-        tasks_objs = svc.get_tasks_by_category(category)
+        tasks_objs = svc.get_tasks_by_category(category, tag)
     else:
-        tasks_objs = svc.get_tasks_by_category_and_user(category, selected_user)
+        tasks_objs = svc.get_tasks_by_category_and_user(category, selected_user, tag)
 
     today = date.today()
     tasks = format_tasks_for_display(tasks_objs, today)
@@ -191,31 +475,327 @@ def handle_category_view(category, selected_user, users, view):
         selected_user=selected_user,
         users=users,
         today=today.isoformat(),
-        view=view
+        view=view,
+        tag=tag
     )
 
 
-def handle_backlog_view(users, view):
+def handle_backlog_view(users, view, tag=None):
     """
-    Handles the backlog view - all tasks for all users
+    Handles the backlog view - all tasks for all users.
+    Only the first page of every column is rendered, the rest is loaded
+    on scroll through handle_board_page. Column totals come from SQL.
 
     Args:
         users: List of all users
         view: Current view
+        tag: Optional tag to filter tasks by
 
     Returns:
         Rendered template
     """
-    tasks_objs = svc.get_all_tasks()
-    today = date.today()
+    tasks_objs = {}
+    next_cursors = {}
+    for col in STATUSES:
+        tasks_objs[col], cursor = svc.get_tasks_page(col, limit=BOARD_PAGE_SIZE, tag=tag)
+        next_cursors[col] = encode_cursor(cursor)
 
+    today = date.today()
     tasks = format_tasks_for_display(tasks_objs, today)
+    column_counts = svc.get_task_summary(tag=tag)["by_status"]
 
     return render_template(
         "index.html",
         tasks=tasks,
+        next_cursors=next_cursors,
+        column_counts=column_counts,
         selected_user="all",
         users=users,
         today=today.isoformat(),
-        view=view
-    )
\ No newline at end of file
+        view=view,
+        tag=tag
+    )
+
+
+def handle_board_page(view, selected_user, status, cursor, limit=BOARD_PAGE_SIZE, tag=None):
+    """
+    Returns one page of a board column as JSON
+
+    Args:
+        view: Current view (users, ad-hoc, reg, pro, backlog)
+        selected_user: Selected user or "all"
+        status: Column to load
+        cursor: Encoded cursor of the last task already shown, or None
+        limit: Page size
+        tag: Optional tag to filter tasks by
+
+    Returns:
+        JSON response with the formatted tasks and the cursor of the next page
+    """
+    if status not in STATUSES:
+        return jsonify({"error": f"Unknown status: {status}"}), 400
+
+    category = view.upper() if view in ["ad-hoc", "reg", "pro"] else None
+    username = selected_user if selected_user and selected_user != "all" and view != "backlog" else None
+
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return jsonify({"error": f"Invalid cursor: {cursor}"}), 400
+
+    tasks_objs, next_cursor = svc.get_tasks_page(status, category, username, after, limit, tag)
+    tasks = format_tasks_for_display({status: tasks_objs}, date.today())
+
+    return jsonify({
+        "tasks": tasks[status],
+        "next_cursor": encode_cursor(next_cursor)
+    })
+
+
+def handle_search(text, page, limit):
+    """
+    Returns one page of full-text search results as JSON
+
+    Args:
+        text: Search string
+        page: Page number, starting at 1
+        limit: Page size
+
+    Returns:
+        JSON response with the formatted tasks, ordered by relevance
+    """
+    tasks_objs, has_more = svc.search_tasks(text, page, limit)
+    today = date.today()
+
+    return jsonify({
+        "query": text,
+        "page": page,
+        "tasks": [format_task_for_display(t, today) for t in tasks_objs],
+        "has_more": has_more
+    })
+
+
+def handle_archive_page(selected_user, category, cursor, limit):
+    """
+    Returns one page of archived tasks as JSON, most recently done first
+
+    Args:
+        selected_user: Username to filter by, or None/"all"
+        category: Task category (AD-HOC, REG, PRO) or None
+        cursor: Encoded cursor of the last task already shown, or None
+        limit: Page size
+
+    Returns:
+        JSON response with the formatted tasks and the cursor of the next page
+    """
+    try:
+        after = decode_cursor(cursor)
+    except ValueError:
+        return jsonify({"error": f"Invalid cursor: {cursor}"}), 400
+
+    username = selected_user if selected_user and selected_user != "all" else None
+    category = category.upper() if category else None
+    tasks_objs, next_cursor = archive.get_archive_page(username, category, after, limit)
+    today = date.today()
+
+    tasks = []
+    for t in tasks_objs:
+        task = format_task_for_display(t, today)
+        task["archived_at"] = t.archived_at.isoformat() if t.archived_at else None
+        tasks.append(task)
+
+    return jsonify({
+        "tasks": tasks,
+        "next_cursor": encode_cursor(next_cursor)
+    })
+
+
+def export_task_lines(tasks_objs, fmt, batch_size=1000):
+    """
+    Generates the lines of a task export
+
+    Lines are buffered and yielded batch_size rows at a time, so a large
+    export is sent in chunks without building the whole file in memory.
+
+    Args:
+        tasks_objs: Iterable of task rows
+        fmt: Export format, csv or jsonl
+        batch_size: Number of rows per yielded chunk
+
+    Yields:
+        Chunks of CSV or JSON Lines text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer:
+        writer.writerow(EXPORT_FIELDS)
+
+    for i, t in enumerate(tasks_objs, 1):
+        row = [getattr(t, name) for name in EXPORT_FIELDS]
+        row = [value.isoformat() if isinstance(value, date) else value for value in row]
+        if writer:
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n")
+
+        if i % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def handle_export(view, selected_user, users, fmt, tag=None):
+    """
+    Streams the tasks of a category or backlog view as CSV or JSON Lines
+
+    Uses the same filters as handle_category_view and handle_backlog_view.
+
+    Args:
+        view: Exported view (ad-hoc, reg, pro, backlog)
+        selected_user: Selected user or "all" (ignored for the backlog)
+        users: List of all users
+        fmt: Export format, csv or jsonl
+        tag: Optional tag to filter tasks by
+
+    Returns:
+        Streaming response with the export as an attachment, or an error with status 400
+    """
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"Unknown format: {fmt}"}), 400
+    if view not in ["ad-hoc", "reg", "pro", "backlog"]:
+        return jsonify({"error": f"View cannot be exported: {view}"}), 400
+
+    category = view.upper() if view != "backlog" else None
+    username = selected_user if view != "backlog" and selected_user in users else None
+
+    filename = f"kanban-{view}-{date.today().isoformat()}.{fmt}"
+    lines = export_task_lines(svc.iter_tasks(category, username, tag), fmt)
+    return Response(
+        stream_with_context(lines),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+def format_change_event(event, task, vacation, today):
+    """
+    Formats a change event as a Server-Sent Events message
+
+    The current state of the changed object is sent with the event. If the
+    object no longer exists, the event is sent as a delete.
+
+    Args:
+        event: ChangeEvent object
+        task: Current task row for task events, or None
+        vacation: Current Vacation object for vacation events, or None
+        today: Current date
+
+    Returns:
+        SSE message string
+    """
+    data = {"action": event.action, "id": event.entity_id}
+    if event.payload:
+        data.update(json.loads(event.payload))
+
+    if event.entity == "task":
+        if task is None:
+            data["action"] = "delete"
+        else:
+            data["task"] = format_task_for_display(task, today)
+    elif event.entity == "vacation":
+        if vacation is None:
+            data["action"] = "delete"
+        else:
+            data["vacation"] = format_vacation_for_display(vacation, today)
+
+    return f"id: {event.id}\nevent: {event.entity}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def stream_changes(last_id, poll_interval=2.0, max_duration=30.0, resume=False):
+    """
+    Generates Server-Sent Events for the changes recorded after last_id
+
+    The change log is polled in the database, so changes made by any worker
+    process are delivered. The stream ends after max_duration seconds and
+    the browser reconnects with the Last-Event-ID header, which keeps
+    connections from pinning a worker forever.
+
+    Changes can commit out of ID order, so every poll also re-reads the last
+    CHANGE_REPLAY_WINDOW IDs and sends the events this stream has not sent
+    yet. A resumed stream replays that window too; the browser skips the
+    events it already applied.
+
+    Args:
+        last_id: ID of the last event the client has seen
+        poll_interval: Seconds between polls of the change log
+        max_duration: Seconds after which the stream is closed
+        resume: True if the client reconnects after receiving events
+
+    Yields:
+        SSE message strings
+    """
+    yield f"retry: {int(poll_interval * 1000)}\n\n"
+
+    # A new board already shows the committed changes
+    sent = set() if resume else events.get_change_ids(last_id - CHANGE_REPLAY_WINDOW, last_id)
+
+    deadline = time.monotonic() + max_duration
+    while time.monotonic() < deadline:
+        changes = events.get_changes_since(last_id, window=CHANGE_REPLAY_WINDOW, exclude=sent)
+        if changes:
+            tasks = svc.get_tasks_by_ids(e.entity_id for e in changes if e.entity == "task")
+            vacations = svc.get_vacations_by_ids(e.entity_id for e in changes if e.entity == "vacation")
+            today = date.today()
+            for event in changes:
+                yield format_change_event(
+                    event,
+                    tasks.get(event.entity_id) if event.entity == "task" else None,
+                    vacations.get(event.entity_id) if event.entity == "vacation" else None,
+                    today
+                )
+            sent.update(event.id for event in changes)
+            last_id = max(last_id, changes[-1].id)
+            sent = {event_id for event_id in sent if event_id > last_id - CHANGE_REPLAY_WINDOW}
+        else:
+            yield ": keep-alive\n\n"
+
+        # Give the connection back to the pool while waiting
+        db.session.close()
+        if len(changes) < 100:
+            time.sleep(poll_interval)
+
+
+def handle_gantt_data(start_date, end_date, username):
+    """
+    Returns vacations for the Gantt chart in a compact columnar JSON shape
+
+    Each field is a list with one value per vacation. Usernames are stored
+    once in "users" and referenced by position from "user".
+
+    Args:
+        start_date: Optional start of the period
+        end_date: Optional end of the period
+        username: Optional username to filter by
+
+    Returns:
+        JSON response, gzip-compressed if the client accepts it
+    """
+    rows = svc.get_gantt_vacations(start_date, end_date, username)
+
+    users = []
+    user_index = {}
+    data = {"users": users, "id": [], "user": [], "start_date": [], "end_date": [], "status": [], "comment": []}
+    for row in rows:
+        if row.username not in user_index:
+            user_index[row.username] = len(users)
+            users.append(row.username)
+        data["id"].append(row.id)
+        data["user"].append(user_index[row.username])
+        data["start_date"].append(row.start_date.isoformat())
+        data["end_date"].append(row.end_date.isoformat())
+        data["status"].append(row.status)
+        data["comment"].append(row.comment or "")
+
+    return compressed_json(data)
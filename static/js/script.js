@@ -51,6 +51,7 @@ function openSidebar(task, col, task_id, view) {
     const sidebar = document.getElementById('task-sidebar');
     sidebar.style.display = 'block';
     sidebar.style.right = '0';
+    showSidebarError('');
 
     document.getElementById('sidebar-title').innerText = task.title;
 
@@ -81,15 +82,32 @@ function openSidebar(task, col, task_id, view) {
 }
 
 /**
- * Opens sidebar from list item click event
+ * Opens sidebar from list item click event.
+ * Cards only carry a summary, the full task is loaded from the server.
  * @param {HTMLElement} el - The clicked list item element
  * @param {string} col - The column where the task is located
  */
 function openSidebarFromLi(el, col) {
-    const task = JSON.parse(el.getAttribute('data-task'));
     const urlParams = new URLSearchParams(window.location.search);
     const view = urlParams.get('view') || 'users';
-    openSidebar(task, col, task.id, view);
+    fetchTask(el.dataset.id)
+        .then(task => openSidebar(task, col, task.id, view))
+        .catch(error => console.error('Error loading task:', error));
+}
+
+/**
+ * Loads the full data of a task
+ * @param {number|string} taskId - The ID of the task
+ * @returns {Promise<Object>} The task
+ */
+function fetchTask(taskId) {
+    return fetch(`/task/${taskId}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`Task request failed with status ${response.status}`);
+            }
+            return response.json();
+        });
 }
 
 /**
@@ -102,7 +120,7 @@ function closeSidebar() {
 }
 
 // Add event listener for sidebar form submission
-document.getElementById('sidebar-form').addEventListener('submit', function() {
+document.getElementById('sidebar-form').addEventListener('submit', function(e) {
     const editableTitle = document.getElementById('sidebar-title').textContent;
     document.getElementById('sidebar-hidden-title').value = editableTitle;
 
@@ -112,8 +130,152 @@ document.getElementById('sidebar-form').addEventListener('submit', function() {
     if (viewInput) {
         viewInput.value = view;
     }
+
+    // Save in place; fall back to the regular form post only if the server
+    // could not be reached or failed, not when it rejected the input
+    e.preventDefault();
+    const form = this;
+    const data = new FormData(form);
+    const fields = {};
+    ['title', 'status', 'type', 'priority', 'start_date', 'deadline', 'tags', 'task_type', 'comment'].forEach(name => {
+        fields[name] = data.get(name) || '';
+    });
+
+    updateTask(data.get('task_id'), fields)
+        .then(() => closeSidebar())
+        .catch(error => {
+            if (error.status && error.status < 500) {
+                showSidebarError(error.message);
+            } else {
+                form.submit();
+            }
+        });
 });
 
+/**
+ * Shows an error in the task sidebar, or hides it
+ * @param {string} message - The error message, empty to hide it
+ */
+function showSidebarError(message) {
+    const box = document.getElementById('sidebar-error');
+    box.textContent = message;
+    box.style.display = message ? 'block' : 'none';
+}
+
+/**
+ * Sends changed task fields to the server and puts the returned card on the board
+ * @param {number|string} taskId - The ID of the task to update
+ * @param {Object} fields - The task fields to change
+ * @returns {Promise<Object>} The updated task; on an error response the promise
+ *     is rejected with an Error carrying the HTTP status and the server's message
+ */
+function updateTask(taskId, fields) {
+    return fetch(`/task/${taskId}`, {
+        method: 'PATCH',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(fields)
+    })
+        .then(response => {
+            if (!response.ok) {
+                return response.json()
+                    .catch(() => ({}))
+                    .then(body => {
+                        const error = new Error(body.error || `Task update failed with status ${response.status}`);
+                        error.status = response.status;
+                        throw error;
+                    });
+            }
+            return response.json();
+        })
+        .then(task => {
+            placeTaskCard(task);
+            return task;
+        });
+}
+
+/**
+ * Puts a task card into its status column, replacing the previous card of the task.
+ * The card is removed if the task no longer matches the current view or tag filter.
+ * In a paginated column, a task that was not shown yet is only added if it sorts
+ * before the pages still to load; otherwise it arrives with its page.
+ * @param {Object} task - The task data
+ * @param {boolean} created - True if the task is new, so the column total grows
+ */
+function placeTaskCard(task, created = false) {
+    const shown = removeTaskCard(task.id);
+
+    const view = getUrlParameter('view') || 'users';
+    const tag = getUrlParameter('tag');
+    const userSelect = document.getElementById('user');
+    const selectedUser = userSelect ? userSelect.value : 'all';
+    if (view === 'vacation') {
+        return;
+    }
+    if (selectedUser !== 'all' && task.username !== selectedUser) {
+        return;
+    }
+    if (['ad-hoc', 'reg', 'pro'].includes(view) && task.task_type !== view.toUpperCase()) {
+        return;
+    }
+    if (tag && !(task.tags || '').split(',').includes(tag)) {
+        return;
+    }
+
+    const column = document.querySelector(`.column[data-status="${task.status}"]`);
+    if (!column) {
+        return;
+    }
+    const ul = column.querySelector('ul');
+    if (!shown && !created && ul.dataset.nextCursor && !sortsBeforeCursor(task, ul.dataset.nextCursor)) {
+        return;
+    }
+    ul.prepend(createTaskElement(task, task.status));
+    if (shown || created) {
+        changeColumnCount(column, 1);
+    }
+}
+
+/**
+ * Checks whether a task comes before a column cursor (newest status date first, then highest ID)
+ * @param {Object} task - The task data
+ * @param {string} cursor - Cursor in the format yyyy-mm-dd:id
+ * @returns {boolean} True if the task sorts before the cursor
+ */
+function sortsBeforeCursor(task, cursor) {
+    const [cursorDate, cursorId] = cursor.split(':');
+    if (task.status_date !== cursorDate) {
+        return task.status_date > cursorDate;
+    }
+    return Number(task.id) > Number(cursorId);
+}
+
+/**
+ * Removes the card of a task from the board, if it is shown
+ * @param {number|string} taskId - The ID of the task
+ * @returns {boolean} True if a card was removed
+ */
+function removeTaskCard(taskId) {
+    const card = document.querySelector(`li[data-id="${taskId}"]`);
+    if (card) {
+        changeColumnCount(card.closest('.column'), -1);
+        card.remove();
+        return true;
+    }
+    return false;
+}
+
+/**
+ * Adjusts the card counter shown under a column title
+ * @param {HTMLElement} column - The column element
+ * @param {number} delta - The number of cards added (negative if removed)
+ */
+function changeColumnCount(column, delta) {
+    const counter = column && column.querySelector('.column-count');
+    if (counter) {
+        counter.textContent = Math.max(0, parseInt(counter.textContent || '0', 10) + delta);
+    }
+}
+
 // Add event listener for task deletion form submission
 document.getElementById('delete-task-form').addEventListener('submit', function(e) {
     const urlParams = new URLSearchParams(window.location.search);
@@ -198,6 +360,13 @@ document.addEventListener('DOMContentLoaded', function() {
 function setupDragAndDrop() {
     const columns = document.querySelectorAll('.column');
 
+    document.addEventListener('dragstart', function(e) {
+        const li = e.target.closest && e.target.closest('li[data-id]');
+        if (li) {
+            e.dataTransfer.setData('text/plain', li.dataset.id);
+        }
+    });
+
     columns.forEach(column => {
         column.addEventListener('dragover', function(e) {
             e.preventDefault();
@@ -213,9 +382,14 @@ function setupDragAndDrop() {
             this.style.backgroundColor = 'rgba(255,255,255,0.9)';
 
             const taskId = e.dataTransfer.getData('text/plain');
-            const newStatus = this.querySelector('h2').textContent.toLowerCase().replace(' ', '_');
+            const newStatus = this.dataset.status;
+            const card = document.querySelector(`li[data-id="${taskId}"]`);
+            if (!taskId || !card || card.closest('.column') === this) {
+                return;
+            }
 
-            console.log(`Moving task ${taskId} to ${newStatus}`);
+            updateTask(taskId, { status: newStatus })
+                .catch(error => console.error('Error moving task:', error));
         });
     });
 }
@@ -234,23 +408,18 @@ function getUrlParameter(name) {
  * Updates the days in status counter for all tasks
  */
 function updateDaysInStatus() {
-    const today = new Date().toISOString().split('T')[0];
-    const taskItems = document.querySelectorAll('li[data-task]');
+    const todayDate = new Date(new Date().toISOString().split('T')[0]);
+    const taskItems = document.querySelectorAll('li[data-status-date]');
 
     taskItems.forEach(item => {
-        const task = JSON.parse(item.getAttribute('data-task'));
-        const statusDate = new Date(task.status_date);
-        const todayDate = new Date(today);
+        const statusDate = new Date(item.dataset.statusDate);
         const diffTime = Math.abs(todayDate - statusDate);
         const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
 
-        const daysElement = item.querySelector('small');
+        const daysElement = item.querySelector('.days-in-status');
         if (daysElement) {
             daysElement.textContent = `Days in this status: ${diffDays}`;
         }
-
-        task.days_in_status = diffDays;
-        item.setAttribute('data-task', JSON.stringify(task));
     });
 }
 
@@ -343,17 +512,24 @@ function smoothUpdateUI() {
  * Updates the tasks UI based on provided tasks data
  * @param {Object} tasks - The tasks data to display
  * @param {string} view - The current view mode
+ * @param {boolean} append - Append to the existing cards instead of replacing them
  */
-function updateTasksUI(tasks, view) {
+function updateTasksUI(tasks, view, append = false) {
     const columns = document.querySelectorAll('.column');
 
     columns.forEach(column => {
-        const colName = column.querySelector('h2').textContent.toLowerCase().replace(' ', '_');
+        const colName = column.dataset.status;
         const ul = column.querySelector('ul');
-        ul.innerHTML = '';
+        if (!append) {
+            ul.innerHTML = '';
+        }
 
         if (tasks[colName]) {
             tasks[colName].forEach(task => {
+                // A card already placed by a live update
+                if (append && !task.is_vacation && ul.querySelector(`li[data-id="${task.id}"]`)) {
+                    return;
+                }
                 let li;
                 if (view === 'vacation' && task.is_vacation) {
                     li = createVacationElement(task, colName);
@@ -366,6 +542,135 @@ function updateTasksUI(tasks, view) {
     });
 }
 
+/**
+ * Creates a task element for display in the UI
+ * @param {Object} task - The task object
+ * @param {string} col - The column where the task should be displayed
+ * @returns {HTMLElement} The created task list item element
+ */
+function createTaskElement(task, col) {
+    const view = getUrlParameter('view') || 'users';
+    const selectedUser = getUrlParameter('user') || 'all';
+
+    const li = document.createElement('li');
+    li.className = col;
+    li.draggable = true;
+    li.dataset.id = task.id;
+    li.dataset.statusDate = task.status_date;
+    li.dataset.username = task.username;
+    li.onclick = () => openSidebarFromLi(li, col);
+
+    const content = document.createElement('div');
+
+    const title = document.createElement('span');
+    title.textContent = task.title;
+
+    const daysInStatus = document.createElement('small');
+    daysInStatus.className = `days-in-status ${col}`;
+    daysInStatus.textContent = `Days in this status: ${task.days_in_status}`;
+
+    content.appendChild(title);
+    content.appendChild(daysInStatus);
+
+    if (view === 'backlog' || (selectedUser === 'all' && ['reg', 'ad-hoc', 'pro'].includes(view))) {
+        const username = document.createElement('small');
+        username.style.color = '#555';
+        username.textContent = `👤 ${task.username}`;
+        content.appendChild(username);
+    }
+
+    li.appendChild(content);
+    return li;
+}
+
+/**
+ * Loads the next page of a column and appends it to the board
+ * @param {HTMLElement} column - The column element to extend
+ * @returns {Promise} Resolves when the page has been appended
+ */
+function loadMoreTasks(column) {
+    const ul = column.querySelector('ul');
+    const cursor = ul.dataset.nextCursor;
+    const status = column.dataset.status;
+    if (!cursor || ul.dataset.loading) {
+        return Promise.resolve();
+    }
+
+    ul.dataset.loading = 'true';
+    const params = new URLSearchParams({
+        view: getUrlParameter('view') || 'users',
+        user: getUrlParameter('user') || 'all',
+        status: status,
+        cursor: cursor
+    });
+    const tag = getUrlParameter('tag');
+    if (tag) {
+        params.set('tag', tag);
+    }
+
+    return fetch(`/get_board_page?${params}`)
+        .then(response => response.json())
+        .then(data => {
+            updateTasksUI({[status]: data.tasks}, params.get('view'), true);
+            if (data.next_cursor) {
+                ul.dataset.nextCursor = data.next_cursor;
+            } else {
+                delete ul.dataset.nextCursor;
+                const loader = column.querySelector('.load-more');
+                if (loader) {
+                    loader.remove();
+                }
+            }
+        })
+        .catch(error => {
+            console.error('Error loading tasks:', error);
+        })
+        .finally(() => {
+            delete ul.dataset.loading;
+        })
+        .then(() => {
+            // The observer only fires when visibility changes, so keep loading
+            // while the loader is still within reach after the append
+            const loader = column.querySelector('.load-more');
+            if (ul.dataset.nextCursor && loader && isNearViewport(loader, 200)) {
+                return loadMoreTasks(column);
+            }
+        });
+}
+
+/**
+ * Checks whether an element is in the viewport or within a margin of it
+ * @param {HTMLElement} el - The element to check
+ * @param {number} margin - Distance in pixels counted as near
+ * @returns {boolean} True if the element is near the viewport
+ */
+function isNearViewport(el, margin) {
+    const rect = el.getBoundingClientRect();
+    const height = window.innerHeight || document.documentElement.clientHeight;
+    const width = window.innerWidth || document.documentElement.clientWidth;
+    return rect.bottom >= -margin && rect.top <= height + margin && rect.right >= -margin && rect.left <= width + margin;
+}
+
+/**
+ * Loads more cards whenever the end of a paginated column scrolls into view
+ */
+function setupInfiniteScroll() {
+    const loaders = document.querySelectorAll('.load-more');
+    if (!loaders.length) {
+        return;
+    }
+
+    const observer = new IntersectionObserver(entries => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                loadMoreTasks(entry.target.closest('.column'));
+            }
+        });
+    }, { rootMargin: '200px' });
+
+    loaders.forEach(loader => observer.observe(loader));
+}
+
 /**
  * Creates a vacation element for display in the UI
  * @param {Object} vacation - The vacation object
@@ -375,6 +680,10 @@ function updateTasksUI(tasks, view) {
 function createVacationElement(vacation, col) {
     const li = document.createElement('li');
     li.className = `${col} vacation-item`;
+    if (vacation.highlight) {
+        li.classList.add('highlight');
+    }
+    li.dataset.vacationId = vacation.id;
     li.setAttribute('data-vacation', JSON.stringify(vacation));
     li.onclick = () => openVacationSidebarFromLi(li, col);
 
@@ -405,6 +714,9 @@ function createVacationElement(vacation, col) {
 // Initialize event listeners on document load
 document.addEventListener('DOMContentLoaded', function() {
     updateUIForView();
+    setupInfiniteScroll();
+    setupDragAndDrop();
+    setupLiveUpdates();
 
     const viewSelect = document.getElementById('view');
     const userSelect = document.getElementById('user');
@@ -417,6 +729,101 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 });
 
+/**
+ * Puts a vacation card into its status column, replacing the previous card of the vacation.
+ * The card is removed if the vacation does not belong to the selected user.
+ * @param {Object} vacation - The vacation data
+ */
+function placeVacationCard(vacation) {
+    const existing = document.querySelector(`li[data-vacation-id="${vacation.id}"]`);
+    if (existing) {
+        existing.remove();
+    }
+
+    const userSelect = document.getElementById('user');
+    const selectedUser = userSelect ? userSelect.value : 'all';
+    if (selectedUser !== 'all' && vacation.username !== selectedUser) {
+        return;
+    }
+
+    const column = document.querySelector(`.column[data-status="${vacation.status}"]`);
+    if (column) {
+        column.querySelector('ul').appendChild(createVacationElement(vacation, vacation.status));
+    }
+}
+
+/**
+ * Subscribes to the server change feed and patches cards in place
+ * when tasks or vacations are changed by other users
+ */
+function setupLiveUpdates() {
+    if (!window.EventSource) {
+        return;
+    }
+
+    const view = getUrlParameter('view') || 'users';
+    const source = new EventSource('/events');
+
+    // After a reconnect the server replays recent events, apply every event once
+    const seen = new Set();
+    const isNew = e => {
+        if (seen.has(e.lastEventId)) {
+            return false;
+        }
+        seen.add(e.lastEventId);
+        if (seen.size > 1000) {
+            seen.delete(seen.values().next().value);
+        }
+        return true;
+    };
+
+    source.addEventListener('task', e => {
+        if (!isNew(e)) {
+            return;
+        }
+        const data = JSON.parse(e.data);
+        if (data.action === 'delete') {
+            removeTaskCard(data.id);
+        } else {
+            placeTaskCard(data.task, data.action === 'create');
+        }
+    });
+
+    source.addEventListener('vacation', e => {
+        if (!isNew(e) || view !== 'vacation') {
+            return;
+        }
+        const data = JSON.parse(e.data);
+        if (data.action === 'delete') {
+            const card = document.querySelector(`li[data-vacation-id="${data.id}"]`);
+            if (card) {
+                card.remove();
+            }
+        } else {
+            placeVacationCard(data.vacation);
+        }
+    });
+
+    source.addEventListener('user', e => {
+        if (!isNew(e)) {
+            return;
+        }
+        const data = JSON.parse(e.data);
+        if (data.action === 'delete') {
+            document.querySelectorAll('li[data-username]').forEach(li => {
+                if (li.dataset.username === data.username) {
+                    li.remove();
+                }
+            });
+            document.querySelectorAll('li[data-vacation]').forEach(li => {
+                if (JSON.parse(li.dataset.vacation).username === data.username) {
+                    li.remove();
+                }
+            });
+        }
+    });
+}
+
 // Global variables for Gantt chart
 let ganttChart = null;
 let vacationData = [];
@@ -426,6 +833,7 @@ let vacationData = [];
  */
 function openGanttModal() {
   document.getElementById('gantt-modal').style.display = 'block';
+  initGanttControls();
   loadVacationData();
 }
 
@@ -441,14 +849,18 @@ function closeGanttModal() {
 }
 
 /**
- * Loads vacation data for the Gantt chart via AJAX
+ * Loads vacation data of the selected period for the Gantt chart via AJAX
  */
 function loadVacationData() {
-  fetch('/get_vacations_data')
+  const params = new URLSearchParams({
+    start: document.getElementById('gantt-start-date').value,
+    end: document.getElementById('gantt-end-date').value
+  });
+
+  fetch(`/get_vacations_data?${params}`)
     .then(response => response.json())
     .then(data => {
-      vacationData = data;
-      initGanttControls();
+      vacationData = unpackVacationColumns(data);
       renderGanttChart();
     })
     .catch(error => {
@@ -456,6 +868,22 @@ function loadVacationData() {
     });
 }
 
+/**
+ * Converts the columnar vacation payload into a list of vacation objects
+ * @param {Object} data - Columns of vacation fields and the list of usernames
+ * @returns {Array} Array of vacation objects
+ */
+function unpackVacationColumns(data) {
+  return data.id.map((id, i) => ({
+    id: id,
+    username: data.users[data.user[i]],
+    start_date: data.start_date[i],
+    end_date: data.end_date[i],
+    status: data.status[i],
+    comment: data.comment[i]
+  }));
+}
+
 /**
  * Initializes Gantt chart controls with default values
  */
@@ -485,8 +913,9 @@ function formatDateForInput(date) {
 function updateGanttChart() {
   if (ganttChart) {
     ganttChart.destroy();
+    ganttChart = null;
   }
-  renderGanttChart();
+  loadVacationData();
 }
 
 /**
@@ -513,6 +942,9 @@ function renderGanttChart() {
     const endInput = document.getElementById("gantt-end-date").value;
 
     const parseDate = str => {
+        if (str.includes('-')) {
+            return new Date(str);
+        }
         const [d, m, y] = str.split('/');
         return new Date(`${y}-${m}-${d}`);
     }
@@ -521,13 +953,8 @@ function renderGanttChart() {
     const endDate = parseDate(endInput);
     const today = new Date();
 
-    const filteredData = vacationData.filter(vacation => {
-        const vacationStart = new Date(vacation.start_date);
-        const vacationEnd = new Date(vacation.end_date);
-        return (vacationStart <= endDate && vacationEnd >= startDate);
-    });
-
-    const groupedData = groupVacationsByUser(filteredData);
+    // The server only returns vacations overlapping the selected period
+    const groupedData = groupVacationsByUser(vacationData);
     const users = Object.keys(groupedData);
 
     const datasets = [];
@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+# Benchmark on a throwaway SQLite database: python test/bench_task_rows.py [tasks]
+TASKS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+
+from sqlalchemy.orm import joinedload
+from app import create_app
+from models.cli import setup_database
+from models.models import db, User, Task
+import models.services as svc
+from models.utils import format_tasks_for_display
+
+
+def orm_path(today):
+    """Previous read path: full ORM Task objects, copied into card summaries."""
+    tasks = svc.group_tasks_by_status(Task.query.options(joinedload(Task.user)).all())
+    return {
+        col: [
+            {
+                "id": t.id,
+                "title": t.title,
+                "status": t.status,
+                "status_date": t.status_date.isoformat(),
+                "days_in_status": (today - t.status_date).days,
+                "username": t.user.username
+            }
+            for t in items
+        ]
+        for col, items in tasks.items()
+    }
+
+
+def rows_path(today):
+    """Column-projected rows from models/services.py."""
+    return format_tasks_for_display(svc.get_all_tasks(), today)
+
+
+def measure(name, func, today, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        func(today)
+        timings.append(time.perf_counter() - start)
+
+    db.session.expunge_all()
+    tracemalloc.start()
+    result = func(today)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:6} best {min(timings) * 1000:8.1f} ms | peak memory {peak / 1024 / 1024:7.1f} MiB")
+    return result
+
+
+app = create_app()
+
+with app.app_context():
+    setup_database()
+    statuses = ["todo", "in_progress", "waiting", "done"]
+    db.session.execute(db.insert(User), [{"username": f"user{i}"} for i in range(20)])
+    db.session.execute(db.insert(Task), [
+        {
+            "title": f"Task {i}",
+            "status": statuses[i % 4],
+            "type": "task",
+            "priority": "medium",
+            "start_date": date.today() - timedelta(days=i % 365),
+            "tags": "bench,board",
+            "task_type": "REG",
+            "status_date": date.today() - timedelta(days=i % 30),
+            "user_id": i % 20 + 1,
+            "comment": "Lorem ipsum dolor sit amet " * 4
+        }
+        for i in range(TASKS)
+    ])
+    db.session.commit()
+
+    today = date.today()
+    print(f"=== format_tasks_for_display, {TASKS} tasks ===")
+    orm_result = measure("ORM", orm_path, today)
+    rows_result = measure("rows", rows_path, today)
+    assert orm_result == rows_result, "Both paths must produce the same cards"
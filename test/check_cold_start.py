@@ -0,0 +1,54 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Cold start of a worker process: python test/check_cold_start.py [runs]
+# Every run is a fresh interpreter on an existing database.
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+START = """
+import time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+{schema}
+ready = time.perf_counter()
+client = app.test_client()
+client.get("/login")
+served = time.perf_counter()
+print(imported - start, created - imported, ready - created, served - ready)
+"""
+
+# What every process did at import before the app factory: create_all and the search index DDL
+SCHEMA_AT_BOOT = """
+from models.models import db
+from models.search import create_search_index
+with app.app_context():
+    db.create_all()
+    create_search_index()
+"""
+
+env = dict(os.environ, DATABASE_URL=os.environ.get("DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/cold.db")
+subprocess.run([sys.executable, "-m", "flask", "--app", "app", "upgrade-db"], env=env, cwd=ROOT, check=True)
+
+
+def measure(schema):
+    runs = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", START.format(schema=schema)],
+            env=env, cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        runs.append([float(value) * 1000 for value in output.split()])
+    return [statistics.median(column) for column in zip(*runs)]
+
+
+print(f"Median of {RUNS} runs, ms: imports | create_app | schema | first request | total")
+for name, schema in (("schema work at boot (before)", SCHEMA_AT_BOOT), ("app factory (after)", "")):
+    phases = measure(schema)
+    print(f"{name:30} " + " | ".join(f"{value:7.1f}" for value in phases) + f" | {sum(phases):7.1f}")
@@ -1,6 +1,8 @@
-from app import app
+from app import create_app
 from models.models import User, Task, Vacation
 
+app = create_app()
+
 with app.app_context():
     users = User.query.all()
     print("=== Users ===")
@@ -28,9 +30,11 @@ with app.app_context():
         )
 
 
-# from app import app
+# from app import create_app
 # from models.models import db
 #
+# app = create_app()
+#
 # with app.app_context():
 #     db.drop_all()
 #     db.create_all()
@@ -0,0 +1,32 @@
+from datetime import date
+from app import create_app
+from models.models import db, User, Task, Vacation
+
+# Hot board queries, each should be answered through one of the composite indexes
+QUERIES = {
+    "Tasks of a user by category": db.select(Task).where(
+        Task.user_id == 1, Task.task_type == "REG"
+    ),
+    "Tasks of a category": db.select(Task).where(Task.task_type == "REG"),
+    "Column page (keyset)": db.select(Task).where(
+        Task.status == "done", Task.status_date <= date.today()
+    ).order_by(Task.status_date.desc(), Task.id.desc()).limit(50),
+    "Vacations of a user": db.select(Vacation).where(Vacation.user_id == 1),
+    "Gantt vacations": db.select(Vacation).join(User).order_by(User.username, Vacation.start_date),
+    "Vacations in a date range": db.select(Vacation).where(
+        Vacation.start_date <= date.today(), Vacation.end_date >= date.today()
+    ),
+}
+
+app = create_app()
+
+with app.app_context():
+    dialect = db.engine.dialect.name
+    explain = "EXPLAIN QUERY PLAN" if dialect == "sqlite" else "EXPLAIN"
+
+    for name, query in QUERIES.items():
+        sql = query.compile(db.engine, compile_kwargs={"literal_binds": True})
+        print(f"=== {name} ===")
+        for row in db.session.execute(db.text(f"{explain} {sql}")):
+            print(row[-1])
+        print()
@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import time
+
+# Two SQLite files stand in for the primary and the read replica:
+# python test/check_read_replica.py
+folder = tempfile.mkdtemp()
+primary = os.path.join(folder, "primary.db")
+replica = os.path.join(folder, "replica.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{primary}"
+os.environ["DATABASE_READ_URL"] = f"sqlite:///{replica}"
+os.environ["READ_AFTER_WRITE_SECONDS"] = "1"
+
+from app import create_app
+from models.cli import setup_database
+from models.models import db, Task
+import models.services as svc
+
+app = create_app()
+
+
+def add_task(title):
+    svc.add_task_to_db("ann", title, "todo", "task", "medium", None, None, [], "REG", "")
+
+
+with app.app_context():
+    setup_database()
+    add_task("Replicated")
+
+# "Replication": the replica is a copy of the primary at this point
+shutil.copyfile(primary, replica)
+
+with app.app_context():
+    add_task("Not replicated yet")
+
+client = app.test_client()
+with client.session_transaction() as s:
+    s["logged_in"] = True
+
+
+def todo_titles():
+    response = client.get("/get_board_page", query_string={"view": "backlog", "status": "todo"})
+    return sorted(task["title"] for task in response.get_json()["tasks"])
+
+
+print("=== GET without recent writes reads the replica ===")
+print(todo_titles())
+
+print("=== POST writes to the primary ===")
+response = client.post("/add", data={
+    "user": "ann",
+    "task_title": "Written to the primary",
+    "status": "todo",
+    "task_type": "REG"
+})
+print(response.status_code, response.headers.get("Location"))
+
+print("=== GET right after the redirect reads the primary (read-your-writes) ===")
+print(todo_titles())
+
+time.sleep(1.1)
+print("=== GET after the read-your-writes window reads the replica again ===")
+print(todo_titles())
+
+with app.app_context():
+    query = db.select(Task.title).order_by(Task.title)
+    print("primary:", db.session.scalars(query).all())
+    print("replica:", db.session.scalars(query, bind_arguments={"bind": db.engines["replica"]}).all())
@@ -0,0 +1,93 @@
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+# Task IDs must never be reused: python test/check_task_ids.py
+# Runs on a new database and on a database whose task table predates AUTOINCREMENT.
+from app import create_app
+from models.cli import setup_database
+from models.models import db, Task, TaskArchive, TaskTransition
+from models.archive import archive_done_tasks
+import models.services as svc
+
+failed = False
+
+
+def check(name, ok, detail=""):
+    global failed
+    failed = failed or not ok
+    print(f"{'ok  ' if ok else 'FAIL'} {name}{': ' + detail if detail else ''}")
+
+
+def make_legacy_task_table():
+    # The task table as created before AUTOINCREMENT, keeping its rows
+    schema = db.session.scalar(db.text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'task'"))
+    columns = ", ".join(column.name for column in Task.__table__.columns)
+    db.session.execute(db.text(schema.replace("CREATE TABLE task", "CREATE TABLE task_legacy").replace("AUTOINCREMENT", "")))
+    db.session.execute(db.text(f"INSERT INTO task_legacy ({columns}) SELECT {columns} FROM task"))
+    db.session.execute(db.text("DROP TABLE task"))
+    db.session.execute(db.text("ALTER TABLE task_legacy RENAME TO task"))
+    db.session.commit()
+
+
+def reuse_after_delete(label):
+    # Delete the newest task, add another one: it must get a new ID and no inherited history
+    old_id = svc.add_task_to_db("ann", "Old", "todo", "task", "medium", date.today(), None, [], "PRO", "")
+    svc.edit_task_in_db(old_id, {"status": "done"})
+    svc.delete_task_from_db(old_id)
+    new_id = svc.add_task_to_db("ann", "New", "todo", "task", "medium", date.today(), None, [], "REG", "")
+    history = db.session.execute(
+        db.select(TaskTransition.from_status, TaskTransition.to_status).where(TaskTransition.task_id == new_id)
+    ).all()
+    check(f"{label}: deleted task ID is not reused", new_id != old_id, f"deleted {old_id}, new {new_id}")
+    check(f"{label}: new task has only its own history", [tuple(row) for row in history] == [(None, "todo")], str(history))
+
+
+def archive_twice(label):
+    # Archive the newest task, add one, finish it and archive again
+    long_ago = date.today() - timedelta(days=100)
+    first_id = svc.add_task_to_db("ann", "First", "done", "task", "medium", date.today(), None, [], "REG", "")
+    db.session.execute(db.update(Task).where(Task.id == first_id).values(status_date=long_ago))
+    db.session.commit()
+    archive_done_tasks(90)
+    second_id = svc.add_task_to_db("ann", "Second", "done", "task", "medium", date.today(), None, [], "REG", "")
+    db.session.execute(db.update(Task).where(Task.id == second_id).values(status_date=long_ago))
+    db.session.commit()
+    try:
+        archived = archive_done_tasks(90)
+    except Exception as e:
+        db.session.rollback()
+        archived = f"{type(e).__name__}: {e}"
+    check(f"{label}: archived task ID is not reused", first_id != second_id, f"archived {first_id}, new {second_id}")
+    check(f"{label}: archiver runs again after new tasks got done", archived == 1, str(archived))
+    in_archive = set(db.session.scalars(db.select(TaskArchive.id).where(TaskArchive.id.in_([first_id, second_id]))))
+    check(f"{label}: both tasks are in the archive", in_archive == {first_id, second_id}, str(sorted(in_archive)))
+
+
+for label, legacy in (("new database", False), ("upgraded database", True)):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/ids.db"
+    app = create_app()
+    with app.app_context():
+        setup_database()
+        if db.engine.dialect.name != "sqlite":
+            sys.exit("SQLite only")
+        if legacy:
+            svc.add_task_to_db("ann", "Kept", "todo", "task", "medium", date.today(), None, ["ops"], "REG", "")
+            old_id = svc.add_task_to_db("ann", "Deleted before the upgrade", "todo", "task", "medium",
+                                        date.today(), None, [], "REG", "")
+            make_legacy_task_table()
+            svc.delete_task_from_db(old_id)
+            setup_database()
+            schema = db.session.scalar(db.text("SELECT sql FROM sqlite_master WHERE name = 'task'"))
+            check(f"{label}: task table uses AUTOINCREMENT", "AUTOINCREMENT" in schema)
+            check(f"{label}: rows are kept", db.session.scalar(db.select(db.func.count(Task.id))) == 1)
+            new_id = svc.add_task_to_db("ann", "After the upgrade", "todo", "task", "medium", date.today(), None, [], "REG", "")
+            check(f"{label}: ID of a task deleted before the upgrade is not reused", new_id > old_id,
+                  f"deleted {old_id}, new {new_id}")
+        reuse_after_delete(label)
+        archive_twice(label)
+        db.session.remove()
+        db.engine.dispose()
+
+sys.exit(1 if failed else 0)
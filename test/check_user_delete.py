@@ -0,0 +1,106 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+# Statements and peak memory of deleting a user with many tasks: python test/check_user_delete.py [tasks]
+# The ORM cascade the service used before is measured on a second user with the same data.
+TASKS = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+os.environ["DATABASE_URL"] = os.environ.get("DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/delete.db"
+
+from sqlalchemy import event
+from app import create_app
+from models.cli import setup_database
+from models.models import db, User, Task, Vacation, Tag, task_tag
+from models.search import rebuild_search_index, unindex_tasks
+import models.services as svc
+
+# Statements of the set-based delete, whatever the number of tasks
+MAX_STATEMENTS = 12
+
+app = create_app()
+counts = {"statements": 0}
+
+
+@event.listens_for(db.Engine, "before_cursor_execute")
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    counts["statements"] += 1
+
+
+def seed_user(username):
+    user_id = svc.add_user_to_db(username)
+    tag_ids = svc.upsert_tags(["ops", "release"])
+    today = date.today()
+    db.session.execute(db.insert(Task), [
+        {
+            "title": f"Task {i}", "status": "done", "type": "task", "priority": "medium",
+            "start_date": today - timedelta(days=i % 365), "tags": "ops,release", "task_type": "REG",
+            "status_date": today, "user_id": user_id, "comment": f"Comment {i}"
+        }
+        for i in range(TASKS)
+    ])
+    task_ids = db.session.scalars(db.select(Task.id).where(Task.user_id == user_id)).all()
+    db.session.execute(task_tag.insert(), [
+        {"task_id": task_id, "tag_id": tag_id} for task_id in task_ids for tag_id in tag_ids
+    ])
+    db.session.execute(db.insert(Vacation), [
+        {"user_id": user_id, "start_date": today + timedelta(days=i * 10), "end_date": today + timedelta(days=i * 10 + 3),
+         "status": "todo", "comment": ""}
+        for i in range(50)
+    ])
+    db.session.commit()
+
+
+def delete_with_orm_cascade(username):
+    # delete_user_from_db before the set-based version
+    user = User.query.filter_by(username=username).first()
+    task_ids = [task.id for task in user.tasks]
+    db.session.delete(user)
+    # In chunks, a single IN list of every ID exceeds SQLite's bound parameter limit
+    for i in range(0, len(task_ids), 10000):
+        unindex_tasks(task_ids[i:i + 10000])
+    db.session.commit()
+
+
+def measure(delete, username):
+    with app.app_context():
+        counts["statements"] = 0
+        tracemalloc.start()
+        start = time.perf_counter()
+        delete(username)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return counts["statements"], peak / 1024 / 1024, elapsed
+
+
+with app.app_context():
+    setup_database()
+    seed_user("orm")
+    seed_user("bulk")
+    rebuild_search_index()
+
+print(f"Deleting a user with {TASKS} tasks, {TASKS * 2} tag links and 50 vacations")
+print(f"{'':24} statements  peak MiB  seconds")
+for name, delete, username in (
+    ("ORM cascade (before)", delete_with_orm_cascade, "orm"),
+    ("set-based (after)", svc.delete_user_from_db, "bulk"),
+):
+    statements, peak, elapsed = measure(delete, username)
+    print(f"{name:24} {statements:10} {peak:9.1f} {elapsed:8.2f}")
+
+with app.app_context():
+    left = {
+        "users": db.session.scalar(db.select(db.func.count(User.id))),
+        "tasks": db.session.scalar(db.select(db.func.count(Task.id))),
+        "tag links": db.session.scalar(db.select(db.func.count()).select_from(task_tag)),
+        "vacations": db.session.scalar(db.select(db.func.count(Vacation.id))),
+        "search entries": db.session.scalar(db.text("SELECT count(*) FROM task_fts")),
+        "tags": db.session.scalar(db.select(db.func.count(Tag.id))),
+    }
+print("Left after both deletes: " + ", ".join(f"{value} {name}" for name, value in left.items()))
+
+failed = statements > MAX_STATEMENTS or any(left[name] for name in ("users", "tasks", "tag links", "vacations", "search entries"))
+sys.exit(1 if failed else 0)
@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+# Statements and commits of every write path: python test/check_write_statements.py
+# Each action runs in a fresh application context, like a request.
+os.environ["DATABASE_URL"] = os.environ.get("DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/writes.db"
+
+from sqlalchemy import event
+from app import create_app
+from models.cli import setup_database
+from models.models import db
+import models.services as svc
+from models.cache import get_user_ids
+
+# Expected (statements, commits) on SQLite. Rows are not read before they are
+# written; the only read is the version check of the cached user directory.
+EXPECTED = {
+    "add user": (2, 1),
+    "add existing user": (2, 0),
+    "add task": (8, 1),
+    "add task for a new user": (9, 1),
+    "move task (status only)": (4, 1),
+    "edit task (all fields)": (9, 1),
+    "edit missing task": (2, 0),
+    "delete task": (5, 1),
+    "add vacation": (4, 1),
+    "edit vacation": (3, 1),
+    "delete vacation": (3, 1),
+}
+
+app = create_app()
+counts = {"statements": 0, "commits": 0}
+
+
+@event.listens_for(db.Engine, "before_cursor_execute")
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    counts["statements"] += 1
+
+
+@event.listens_for(db.Engine, "commit")
+def count_commit(conn):
+    counts["commits"] += 1
+
+
+def measure(action):
+    # Reload the user directory if the previous action changed the users
+    with app.app_context():
+        get_user_ids()
+    with app.app_context():
+        counts.update(statements=0, commits=0)
+        action()
+        return counts["statements"], counts["commits"]
+
+
+with app.app_context():
+    setup_database()
+    svc.add_user_to_db("ann")
+    first_task = svc.add_task_to_db("ann", "Warm-up", "todo", "task", "medium", date.today(), None, ["ops"], "REG", "")
+
+today = date.today()
+fields = {
+    "title": "Edited", "status": "in_progress", "type": "ASAP", "priority": "low", "start_date": today,
+    "deadline": today + timedelta(days=3), "tags": ["ops", "release"], "task_type": "PRO", "comment": "Edited"
+}
+actions = {
+    "add user": lambda: svc.add_user_to_db("bob"),
+    "add existing user": lambda: svc.add_user_to_db("bob"),
+    "add task": lambda: svc.add_task_to_db("ann", "Task", "todo", "task", "medium", today, None, ["ops", "docs"], "REG", ""),
+    "add task for a new user": lambda: svc.add_task_to_db("carol", "Task", "todo", "task", "medium", today, None, ["ops"], "REG", ""),
+    "move task (status only)": lambda: svc.edit_task_in_db(first_task, {"status": "done"}),
+    "edit task (all fields)": lambda: svc.edit_task_in_db(first_task, fields),
+    "edit missing task": lambda: svc.edit_task_in_db(first_task + 1000, fields),
+    "delete task": lambda: svc.delete_task_from_db(first_task),
+    "add vacation": lambda: svc.add_vacation("ann", today, today + timedelta(days=5), "", "todo"),
+    "edit vacation": lambda: svc.edit_vacation(1, "done", today, today + timedelta(days=6), "Edited"),
+    "delete vacation": lambda: svc.delete_vacation(1),
+}
+
+failed = False
+print(f"{'action':28} statements commits")
+for name, action in actions.items():
+    statements, commits = measure(action)
+    expected = EXPECTED[name]
+    mark = "" if (statements, commits) == expected else f"  expected {expected[0]} / {expected[1]}"
+    failed = failed or bool(mark)
+    print(f"{name:28} {statements:10} {commits:7}{mark}")
+
+sys.exit(1 if failed else 0)